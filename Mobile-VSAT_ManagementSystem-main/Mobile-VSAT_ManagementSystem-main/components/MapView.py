@@ -1,35 +1,180 @@
 # components/MapView.py
+import atexit
 import math
 import io
+import mmap
 import os
+import sqlite3
+import threading
 import time
-import urllib.request
+from collections import OrderedDict
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+# Pillow-SIMD (`pip install pillow-simd`, same import name) is a drop-in build with
+# SSE4/AVX2 paths for the PNG decode + convert() still done on sidecar misses.
 from PIL import Image, ImageDraw
 from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtGui import QImage
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    # Optional: HTTP/2 multiplexes all tile requests over one TLS connection (needs httpx[http2])
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+__all__ = ["MapWorker", "TilePack", "TILE_SIZE"]
 
 TILE_SIZE = 256
 
+# Tile downloads are network-bound: fetch the missing tiles of a frame in parallel
+# so one slow tile doesn't stall the whole render.
+_TILE_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tile-fetch")
+_TILE_FETCH_WAIT_S = 5.0
+
+# Decoded tiles kept in memory: 256 RGB tiles ~= 48 MiB
+_TILE_CACHE_SIZE = 256
+
+# Negative cache on disk: tiles that failed to download stay skipped across restarts
+_FAIL_DB_NAME = "fails.sqlite3"
+_FAIL_DB_TTL_S = 24 * 3600
+_FAIL_PERSISTED_COOLDOWN_S = 6 * 3600
+
+# Raw RGB sidecar (<tile>.rgb, no header) written next to decoded PNG tiles
+_RAW_TILE_BYTES = TILE_SIZE * TILE_SIZE * 3
+
+# The single "missing tile" image (gray + border). Shared and never mutated,
+# so callers can spot it with an identity check instead of scanning pixels.
+_PLACEHOLDER = Image.new("RGB", (TILE_SIZE, TILE_SIZE), color="#E0E0E0")
+ImageDraw.Draw(_PLACEHOLDER).rectangle([0, 0, TILE_SIZE-1, TILE_SIZE-1], outline="#999999", width=1)
+
+
+@lru_cache(maxsize=128)
+def _deg2num_cached(lat_deg: float, lon_deg: float, zoom: int) -> tuple[float, float]:
+    n = 2.0 ** zoom
+    xtile = (lon_deg + 180.0) / 360.0 * n
+    ytile = (1.0 - math.asinh(math.tan(math.radians(lat_deg))) / math.pi) / 2.0 * n
+    return xtile, ytile
+
+
+class _LRUCache(OrderedDict):
+    """Small O(1) LRU: get() refreshes recency, setting a key evicts the oldest entry."""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class TilePack:
+    """
+    Read/write access to an MBTiles packfile (one sqlite file instead of a tile tree).
+    Uses the standard schema: tiles(zoom_level, tile_column, tile_row, tile_data),
+    with tile_row in TMS order (flipped Y). The connection stays open so sqlite's
+    page cache stays warm; a lock serializes the worker + download threads.
+    """
+
+    _SELECT = "SELECT tile_data FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?"
+    _EXISTS = "SELECT 1 FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?"
+    _INSERT = "INSERT OR REPLACE INTO tiles (zoom_level, tile_column, tile_row, tile_data) VALUES (?, ?, ?, ?)"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+
+    @staticmethod
+    def _tms_row(z: int, y: int) -> int:
+        return (1 << z) - 1 - y
+
+    def get(self, z: int, x: int, y: int) -> bytes | None:
+        with self._lock:
+            row = self._conn.execute(self._SELECT, (z, x, self._tms_row(z, y))).fetchone()
+        return row[0] if row else None
+
+    def has(self, z: int, x: int, y: int) -> bool:
+        with self._lock:
+            row = self._conn.execute(self._EXISTS, (z, x, self._tms_row(z, y))).fetchone()
+        return row is not None
+
+    def put(self, z: int, x: int, y: int, data: bytes):
+        with self._lock, self._conn:
+            self._conn.execute(self._INSERT, (z, x, self._tms_row(z, y), sqlite3.Binary(data)))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
 
 class MapWorker(QObject):
     """
     Offline-first tile renderer:
-    - Tries to read tiles from disk: tile_path_template
+    - Tries the MBTiles packfile next to the tile tree (<tile root>.mbtiles), if present
+    - Then tries to read tiles from disk: tile_path_template
     - If missing, downloads from OpenStreetMap and saves to the same path (cache)
     - Wraps X (world wrap) and clamps Y to valid range
     """
 
-    finished = Signal(bytes)
+    finished = Signal(QImage, float, float)  # raw RGB888 tiles (no marker), marker x/y in px
     error = Signal(str)
     log = Signal(str, str)  # message, level for logging to Terminal Activity
 
+    # Shared keep-alive HTTP clients (reused across all tile fetches for the process lifetime)
+    _session: requests.Session | None = None
+    _h2_client = None  # httpx.Client when httpx + h2 are installed
+    _h2_unavailable = False
+    _http_lock = threading.Lock()  # clients are created lazily from the fetch pool threads
+
     def __init__(self, tile_path_template: str, allow_online: bool = True):
         super().__init__()
         self.tile_path_template = tile_path_template
         self.allow_online = allow_online
 
-        # Simple in-memory cooldown for failed downloads (avoid spamming network)
-        self._fail_cache = {}  # (z,x,y) -> last_fail_time
+        # Cooldown for failed downloads (avoid spamming network), backed by a small sqlite db
+        self._fail_cache = {}  # (z,x,y) -> retry-after (wall clock)
         self._fail_cooldown_s = 30.0
+        self._fail_db_path = os.path.join(
+            os.path.dirname(tile_path_template.split("{")[0]), _FAIL_DB_NAME
+        )
+        self._load_fail_db()
+
+        # Decoded tiles: (z,x,y,mtime_ns) -> Image, or (z,x,y,"pack") for packfile tiles
+        self._tile_cache = _LRUCache(_TILE_CACHE_SIZE)
+
+        # Optional packfile (e.g. assets/osm_tiles/ss4.mbtiles); the per-file tree stays as fallback
+        self._pack: TilePack | None = None
+        pack_path = os.path.normpath(tile_path_template.split("{")[0]) + ".mbtiles"
+        if os.path.exists(pack_path):
+            try:
+                self._pack = TilePack(pack_path)
+            except sqlite3.Error:
+                self._pack = None
+
+        # Newest render request id; older queued run() calls bail out early.
+        # Bumped from the GUI thread via next_request_id() (plain int, GIL-atomic).
+        self._latest_id = 0
 
         # OSM tile URL template (standard)
         self._osm_url = "https://tile.openstreetmap.org/{z}/{x}/{y}.png"
@@ -37,13 +182,61 @@ class MapWorker(QObject):
         # User-Agent is required by many servers
         self._ua = "MVMS/1.0 (PySide6 Tile Renderer)"
 
+    def next_request_id(self) -> int:
+        """Call from the GUI thread before emitting a render; marks older requests stale."""
+        self._latest_id += 1
+        return self._latest_id
+
+    def _is_stale(self, request_id: int) -> bool:
+        return request_id != self._latest_id
+
+    @classmethod
+    def _http(cls) -> requests.Session:
+        with cls._http_lock:
+            if cls._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=16,
+                    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                cls._session = session
+            return cls._session
+
+    @classmethod
+    def _http2(cls):
+        """Shared HTTP/2 httpx client, or None (fall back to the requests session)."""
+        if not HAS_HTTPX or cls._h2_unavailable:
+            return None
+        with cls._http_lock:
+            if cls._h2_client is None:
+                try:
+                    cls._h2_client = httpx.Client(
+                        http2=True,
+                        timeout=httpx.Timeout(3.5, connect=1.0),
+                        limits=httpx.Limits(max_keepalive_connections=16, max_connections=16),
+                    )
+                except ImportError:
+                    # httpx installed without the h2 extra
+                    cls._h2_unavailable = True
+            return cls._h2_client
+
+    @classmethod
+    def close_http(cls):
+        with cls._http_lock:
+            if cls._h2_client is not None:
+                cls._h2_client.close()
+                cls._h2_client = None
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
+
     @staticmethod
     def deg2num(lat_deg: float, lon_deg: float, zoom: int) -> tuple[float, float]:
-        lat_rad = math.radians(lat_deg)
-        n = 2.0 ** zoom
-        xtile = (lon_deg + 180.0) / 360.0 * n
-        ytile = (1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n
-        return xtile, ytile
+        # Pans re-render the same lat/lon, so quantize to ~0.1 m and memoize
+        return _deg2num_cached(round(lat_deg, 6), round(lon_deg, 6), int(zoom))
 
     @staticmethod
     def _wrap_and_clamp(zoom: int, x: int, y: int) -> tuple[int, int]:
@@ -60,6 +253,101 @@ class MapWorker(QObject):
     def _tile_path(self, z: int, x: int, y: int) -> str:
         return self.tile_path_template.format(z=z, x=x, y=y)
 
+    @staticmethod
+    def _raw_path(path: str) -> str:
+        return os.path.splitext(path)[0] + ".rgb"
+
+    @staticmethod
+    def _read_tile_bytes(path: str) -> bytes:
+        """Slurp a tile file in one read so PIL never keeps a lazy file handle."""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            chunks = []
+            while size > 0:
+                chunk = os.read(fd, size)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                size -= len(chunk)
+            return b"".join(chunks)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _decode_tile(data: bytes) -> Image.Image:
+        img = Image.open(io.BytesIO(data))
+        img.load()  # decode eagerly
+        if img.mode != "RGB":  # OSM tiles are usually palette PNGs, but skip the copy when already RGB
+            img = img.convert("RGB")
+        return img
+
+    def _load_tile(self, path: str, mtime: int) -> Image.Image:
+        """
+        Load a tile from disk. Prefers the mmap'd raw RGB sidecar (no PNG decode);
+        otherwise decodes the PNG and writes the sidecar for the next time.
+        """
+        raw_path = self._raw_path(path)
+        try:
+            st = os.stat(raw_path)
+            if st.st_size == _RAW_TILE_BYTES and st.st_mtime_ns >= mtime:
+                with open(raw_path, "rb") as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                # frombuffer maps the pages zero-copy and holds a reference to mm
+                return Image.frombuffer("RGB", (TILE_SIZE, TILE_SIZE), mm, "raw", "RGB", 0, 1)
+        except (OSError, ValueError):
+            pass
+
+        img = self._decode_tile(self._read_tile_bytes(path))
+        if img.size == (TILE_SIZE, TILE_SIZE):
+            try:
+                with open(raw_path, "wb") as f:
+                    f.write(img.tobytes())
+            except OSError:
+                pass  # read-only tile folder: just keep decoding PNGs
+        return img
+
+    # ---------------- persisted fail cache ----------------
+    def _fail_db(self) -> sqlite3.Connection:
+        # Short-lived connection per call: downloads run on pool threads
+        conn = sqlite3.connect(self._fail_db_path, timeout=2.0)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS fails (z INTEGER, x INTEGER, y INTEGER, ts REAL, PRIMARY KEY (z, x, y))"
+        )
+        return conn
+
+    def _load_fail_db(self):
+        if not os.path.exists(self._fail_db_path):
+            return
+        try:
+            with closing(self._fail_db()) as conn, conn:
+                cutoff = time.time() - _FAIL_DB_TTL_S
+                conn.execute("DELETE FROM fails WHERE ts < ?", (cutoff,))
+                for z, x, y, ts in conn.execute("SELECT z, x, y, ts FROM fails"):
+                    self._fail_cache[(z, x, y)] = ts + _FAIL_PERSISTED_COOLDOWN_S
+        except sqlite3.Error:
+            pass
+
+    def _record_fail(self, key: tuple[int, int, int], now: float):
+        self._fail_cache[key] = now + self._fail_cooldown_s
+        try:
+            self._ensure_parent_dir(self._fail_db_path)
+            with closing(self._fail_db()) as conn, conn:
+                conn.execute("INSERT OR REPLACE INTO fails (z, x, y, ts) VALUES (?, ?, ?, ?)", (*key, now))
+        except (OSError, sqlite3.Error):
+            pass
+
+    def _clear_fail(self, key: tuple[int, int, int]):
+        if self._fail_cache.pop(key, None) is None:
+            return
+        try:
+            with closing(self._fail_db()) as conn, conn:
+                conn.execute("DELETE FROM fails WHERE z = ? AND x = ? AND y = ?", key)
+        except sqlite3.Error:
+            pass
+
     def _ensure_parent_dir(self, path: str):
         parent = os.path.dirname(path)
         if parent and not os.path.isdir(parent):
@@ -73,122 +361,226 @@ class MapWorker(QObject):
             return False
 
         key = (z, x, y)
-        now = time.monotonic()
-        last_fail = self._fail_cache.get(key, 0.0)
-        if (now - last_fail) < self._fail_cooldown_s:
+        now = time.time()
+        if now < self._fail_cache.get(key, 0.0):
             return False
 
         url = self._osm_url.format(z=z, x=x, y=y)
         try:
-            req = urllib.request.Request(url, headers={"User-Agent": self._ua})
-            with urllib.request.urlopen(req, timeout=3.5) as resp:
-                data = resp.read()
+            client = self._http2()
+            if client is not None:
+                resp = client.get(url, headers={"User-Agent": self._ua})
+            else:
+                resp = self._http().get(url, timeout=(1.0, 3.5), headers={"User-Agent": self._ua})
+            resp.raise_for_status()
+            data = resp.content
 
             # Save to cache
             self._ensure_parent_dir(save_path)
             with open(save_path, "wb") as f:
                 f.write(data)
+            if self._pack is not None:
+                try:
+                    self._pack.put(z, x, y, data)
+                except sqlite3.Error:
+                    pass  # read-only pack: the file tree still has it
+            self._clear_fail(key)
             return True
 
         except Exception:
-            # remember fail time
-            self._fail_cache[key] = now
+            # remember fail time (memory + disk)
+            self._record_fail(key, now)
             return False
 
-    def _get_tile_image(self, z: int, x: int, y: int) -> Image.Image:
-        """Get a tile image from disk or download. Returns placeholder if unavailable."""
+    def _get_tile_image(self, z: int, x: int, y: int, download: bool = True) -> Image.Image:
+        """
+        Get a tile image from disk or download. Returns placeholder if unavailable.
+        run() prefetches missing tiles concurrently and then calls this with download=False.
+        """
         x, y = self._wrap_and_clamp(z, x, y)
         path = self._tile_path(z, x, y)
 
-        # Try disk first
+        # Packfile first: one indexed query instead of stat + open per tile
+        if self._pack is not None:
+            pack_key = (z, x, y, "pack")
+            cached = self._tile_cache.get(pack_key)
+            if cached is not None:
+                return cached
+            try:
+                data = self._pack.get(z, x, y)
+                if data:
+                    img = self._decode_tile(data)
+                    self._tile_cache[pack_key] = img
+                    return img
+            except Exception as e:
+                self.log.emit(f"Failed to load packed tile {z}/{x}/{y}: {e}", "warning")
+
+        # Memory cache first; the file mtime in the key invalidates re-downloaded tiles
         try:
-            if os.path.exists(path):
-                img = Image.open(path).convert("RGB")
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        key = (z, x, y, mtime)
+        cached = self._tile_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Try disk
+        try:
+            if mtime is not None:
+                img = self._load_tile(path, mtime)
+                self._tile_cache[key] = img
                 return img
         except Exception as e:
             self.log.emit(f"Failed to load tile {z}/{x}/{y}: {e}", "warning")
 
         # If missing, try to download if online mode enabled
-        if self.allow_online:
+        if download and self.allow_online:
             if self._download_tile(z, x, y, path):
                 try:
-                    img = Image.open(path).convert("RGB")
+                    mtime = os.stat(path).st_mtime_ns
+                    img = self._load_tile(path, mtime)
+                    self._tile_cache[(z, x, y, mtime)] = img
                     self.log.emit(f"Downloaded tile {z}/{x}/{y}", "success")
                     return img
                 except Exception as e:
                     self.log.emit(f"Failed to load downloaded tile {z}/{x}/{y}: {e}", "error")
-        
-        # Fallback: gray placeholder with tile coordinates
-        placeholder = Image.new("RGB", (TILE_SIZE, TILE_SIZE), color="#E0E0E0")
-        draw = ImageDraw.Draw(placeholder)
-        # Draw border
-        draw.rectangle([0, 0, TILE_SIZE-1, TILE_SIZE-1], outline="#999999", width=1)
-        # Draw coordinates
-        text = f"{z}/{x}/{y}\noffline"
-        draw.text((TILE_SIZE//2, TILE_SIZE//2), text, fill="#666666", anchor="mm")
-        return placeholder
-
-    @Slot(float, float, int, dict)
-    def run(self, lat: float, lon: float, zoom: int, pan_offset: dict):
+
+        # Fallback: shared gray placeholder (run() logs which tiles were missing)
+        return _PLACEHOLDER
+
+    def _prefetch_tiles(self, z: int, coords: list[tuple[int, int]], request_id: int):
+        """Download all tiles of the frame that are missing on disk, in parallel."""
+        if not self.allow_online:
+            return
+
+        def fetch(x, y, path):
+            # Skip network I/O if a newer render superseded this one while queued
+            if self._is_stale(request_id):
+                return False
+            return self._download_tile(z, x, y, path)
+
+        futures = {}
+        for x, y in coords:
+            path = self._tile_path(z, x, y)
+            if (x, y) in futures or os.path.exists(path):
+                continue
+            if self._pack is not None and self._pack.has(z, x, y):
+                continue
+            futures[(x, y)] = _TILE_EXECUTOR.submit(fetch, x, y, path)
+
+        if not futures:
+            return
+
+        wait(futures.values(), timeout=_TILE_FETCH_WAIT_S)
+        for (x, y), fut in futures.items():
+            if fut.done() and not fut.cancelled() and fut.result():
+                self.log.emit(f"Downloaded tile {z}/{x}/{y}", "success")
+
+    @staticmethod
+    def _grid_span(pixels: int) -> int:
+        """Odd number of tiles that covers `pixels` with the center tile in the middle."""
+        n = math.ceil(max(pixels, 1) / TILE_SIZE)
+        return n if n % 2 else n + 1
+
+    @Slot(float, float, int, dict, int, int, int)
+    def run(self, lat: float, lon: float, zoom: int, pan_offset: dict,
+            viewport_w: int, viewport_h: int, request_id: int):
         """
-        Render a 3x3 tile canvas centered around (lat,lon) at given zoom,
-        with pan_offset in tile units.
+        Render a viewport_w x viewport_h map centered around (lat,lon) at given zoom,
+        with pan_offset in tile units. Only the tiles that cover the viewport are used.
+        Stale requests (request_id older than the latest) are dropped without emitting.
         """
+        if self._is_stale(request_id):
+            return
         try:
             xtile, ytile = MapWorker.deg2num(lat, lon, zoom)
 
             center_x_tile = int(xtile) + int(pan_offset.get("x", 0))
             center_y_tile = int(ytile) + int(pan_offset.get("y", 0))
 
-            canvas = Image.new("RGBA", (TILE_SIZE * 3, TILE_SIZE * 3))
+            cols = self._grid_span(viewport_w)
+            rows = self._grid_span(viewport_h)
+            half_x, half_y = cols // 2, rows // 2
+            canvas_w, canvas_h = cols * TILE_SIZE, rows * TILE_SIZE
+
+            # Viewport-sized grid as (dx, dy, x, y) with wrapped/clamped tile coordinates
+            grid = []
+            for dx in range(-half_x, cols - half_x):
+                for dy in range(-half_y, rows - half_y):
+                    x, y = self._wrap_and_clamp(zoom, center_x_tile + dx, center_y_tile + dy)
+                    grid.append((dx, dy, x, y))
+
+            self._prefetch_tiles(zoom, [(x, y) for _, _, x, y in grid], request_id)
+            if self._is_stale(request_id):
+                return
+
+            # OSM tiles are opaque: composite straight into one RGB buffer
+            if HAS_NUMPY:
+                buf = np.empty((canvas_h, canvas_w, 3), dtype=np.uint8)
+            else:
+                canvas = Image.new("RGB", (canvas_w, canvas_h))
 
             # Track tile loading statistics
             tiles_loaded = 0
-            tiles_missing = 0
-
-            # Paste 3x3 tiles
-            for dx in range(-1, 2):
-                for dy in range(-1, 2):
-                    tile_x = center_x_tile + dx
-                    tile_y = center_y_tile + dy
-
-                    tile_img = self._get_tile_image(zoom, tile_x, tile_y)
-                    
-                    # Check if it's a placeholder (all one color)
-                    colors = tile_img.getcolors(maxcolors=2)
-                    if colors and len(colors) <= 2:  # likely placeholder
-                        tiles_missing += 1
-                    else:
-                        tiles_loaded += 1
-
-                    paste_x = (dx + 1) * TILE_SIZE
-                    paste_y = (dy + 1) * TILE_SIZE
+            missing = []
+
+            # Paste tiles (deterministic order, downloads already done)
+            for dx, dy, tile_x, tile_y in grid:
+                tile_img = self._get_tile_image(zoom, tile_x, tile_y, download=False)
+
+                if tile_img is _PLACEHOLDER:
+                    missing.append(f"{tile_x}/{tile_y}")
+                else:
+                    tiles_loaded += 1
+
+                paste_x = (dx + half_x) * TILE_SIZE
+                paste_y = (dy + half_y) * TILE_SIZE
+                if HAS_NUMPY:
+                    np.copyto(
+                        buf[paste_y:paste_y + TILE_SIZE, paste_x:paste_x + TILE_SIZE],
+                        np.asarray(tile_img, dtype=np.uint8),
+                    )
+                else:
                     canvas.paste(tile_img, (paste_x, paste_y))
 
+            if self._is_stale(request_id):
+                return
+
+            # Crop the tile grid down to the viewport, keeping the center tile centered
+            crop_w = max(1, min(viewport_w, canvas_w))
+            crop_h = max(1, min(viewport_h, canvas_h))
+            left = (canvas_w - crop_w) // 2
+            top = (canvas_h - crop_h) // 2
+            if HAS_NUMPY:
+                canvas = Image.fromarray(np.ascontiguousarray(buf[top:top + crop_h, left:left + crop_w]), "RGB")
+            else:
+                canvas = canvas.crop((left, top, left + crop_w, top + crop_h))
+
             # Log tile statistics
-            if tiles_missing > 0:
-                self.log.emit(f"Map rendered: {tiles_loaded} tiles loaded, {tiles_missing} missing (zoom {zoom})", "warning")
+            if missing:
+                self.log.emit(
+                    f"Map rendered: {tiles_loaded} tiles loaded, {len(missing)} missing (zoom {zoom}: {', '.join(missing)})",
+                    "warning",
+                )
             
-            # Draw red dot marker where the lat/lon lands inside the center tile
-            draw = ImageDraw.Draw(canvas)
-
+            # Marker position (where lat/lon lands inside the center tile); the GUI draws it
             x_offset = (xtile % 1) * TILE_SIZE
             y_offset = (ytile % 1) * TILE_SIZE
 
-            dot_x = TILE_SIZE + x_offset - (pan_offset.get("x", 0) * TILE_SIZE)
-            dot_y = TILE_SIZE + y_offset - (pan_offset.get("y", 0) * TILE_SIZE)
-
-            r = 6
-            # Draw marker with white outline for visibility
-            draw.ellipse([dot_x - r - 1, dot_y - r - 1, dot_x + r + 1, dot_y + r + 1], fill="white")
-            draw.ellipse([dot_x - r, dot_y - r, dot_x + r, dot_y + r], fill="red", outline="black", width=2)
+            dot_x = half_x * TILE_SIZE + x_offset - (pan_offset.get("x", 0) * TILE_SIZE) - left
+            dot_y = half_y * TILE_SIZE + y_offset - (pan_offset.get("y", 0) * TILE_SIZE) - top
 
-            # Encode to PNG bytes
-            buffer = io.BytesIO()
-            canvas.save(buffer, format="PNG")
-            self.finished.emit(buffer.getvalue())
+            # Hand the raw pixels to the GUI thread; copy() detaches from our buffer
+            w, h = canvas.size
+            frame = QImage(canvas.tobytes(), w, h, w * 3, QImage.Format.Format_RGB888).copy()
+            self.finished.emit(frame, float(dot_x), float(dot_y))
 
         except Exception as e:
             error_msg = f"Map generation failed: {type(e).__name__}: {e}"
             self.error.emit(error_msg)
             self.log.emit(error_msg, "error")
+
+
+atexit.register(MapWorker.close_http)
@@ -8,10 +8,16 @@ from PySide6.QtGui import (
     QFont,
     QPixmap,
 )
-from PySide6.QtCore import Qt, QSize, QPointF, QRectF
+from PySide6.QtCore import Qt, QSize, QPointF, QRectF, QLineF, QEvent
 
 from components.utils import resource_path
 
+# Tick directions never change: (angle, cos, sin) for every 15°, 0° = north
+_COMPASS_TICKS = tuple(
+    (a, math.cos(math.radians(a - 90)), math.sin(math.radians(a - 90)))
+    for a in range(0, 360, 15)
+)
+
 
 class CompassWidget(QWidget):
     """
@@ -63,6 +69,8 @@ class CompassWidget(QWidget):
                     self._ruler = pm
                     break
 
+        self._refresh_theme()
+
     def set_azimuth(self, angle: float):
         self.angle = float(angle)
         self.update()
@@ -93,10 +101,45 @@ class CompassWidget(QWidget):
         bg = self.palette().color(self.backgroundRole())
         return bg.value() >= 160
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def _refresh_theme(self):
+        is_light = self._is_light_mode()
+        self._is_light = is_light
+        self._ring_pen = QPen(QColor(0, 0, 0, 30) if is_light else QColor(255, 255, 255, 40), 2)
+        self._tick_pen = QPen(QColor(0, 0, 0, 50) if is_light else QColor(255, 255, 255, 60), 1)
+        self._major_tick_pen = QPen(self._tick_pen.color(), 2)
+        self._label_color = QColor(0, 0, 0, 180) if is_light else QColor(255, 255, 255, 200)
+        self._status_color = QColor(0, 0, 0, 220) if is_light else QColor(255, 255, 255, 230)
+
+        family = self.font().family()
+        self._label_font = QFont(family, 9)
+        self._status_font = QFont(family, 10)
+        self._status_font.setBold(True)
+        self._static_overlay = None
+
+    def changeEvent(self, event):
+        # Pens/fonts only depend on palette + font, so rebuild them only when those change
+        if event.type() in (QEvent.Type.PaletteChange, QEvent.Type.StyleChange, QEvent.Type.FontChange):
+            self._refresh_theme()
+        super().changeEvent(event)
+
+    def resizeEvent(self, event):
+        self._static_overlay = None  # geometry changed: rebuild on next paint
+        super().resizeEvent(event)
+
+    def _build_static_overlay(self) -> QPixmap:
+        """
+        Everything that doesn't depend on the azimuth (background, ruler, ring,
+        ticks, N/E/S/W) rendered once into a pixmap; repaints just blit it.
+        """
+        dpr = self.devicePixelRatioF()
+        pm = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pm)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
 
         side = min(self.width(), self.height())
         center = QPointF(self.width() / 2, self.height() / 2)
@@ -106,10 +149,7 @@ class CompassWidget(QWidget):
         tick_outer = (side / 2) * 0.90
         tick_inner = (side / 2) * 0.86
 
-        is_light = self._is_light_mode()
-
-        ring_pen = QPen(QColor(0, 0, 0, 30) if is_light else QColor(255, 255, 255, 40), 2)
-        tick_pen = QPen(QColor(0, 0, 0, 50) if is_light else QColor(255, 255, 255, 60), 1)
+        is_light = self._is_light
 
         # Draw background image if present
         if not self._bg.isNull():
@@ -138,39 +178,58 @@ class CompassWidget(QWidget):
             painter.restore()
 
         # Outer ring
-        painter.setPen(ring_pen)
+        painter.setPen(self._ring_pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawEllipse(center, outer_radius, outer_radius)
 
         # Ticks + cardinal labels
-        painter.setFont(QFont(self.font().family(), 9))
-        for angle in range(0, 360, 15):
-            rad = math.radians(angle - 90)
-            x1 = center.x() + tick_inner * math.cos(rad)
-            y1 = center.y() + tick_inner * math.sin(rad)
-            x2 = center.x() + tick_outer * math.cos(rad)
-            y2 = center.y() + tick_outer * math.sin(rad)
-
-            if angle % 90 == 0:
-                # Longer cardinal ticks
-                painter.setPen(QPen(tick_pen.color(), 2))
-                painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
-
-                label = {0: "N", 90: "E", 180: "S", 270: "W"}[angle]
-                tx = center.x() + text_radius * math.cos(rad)
-                ty = center.y() + text_radius * math.sin(rad)
-                painter.setPen(QColor(0, 0, 0, 180) if is_light else QColor(255, 255, 255, 200))
-                painter.drawText(
-                    int(tx - 15),
-                    int(ty - 15),
-                    30,
-                    30,
-                    Qt.AlignmentFlag.AlignCenter,
-                    label,
-                )
-            else:
-                painter.setPen(tick_pen)
-                painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+        painter.setFont(self._label_font)
+        cx, cy = center.x(), center.y()
+        minor_lines = []
+        major_lines = []
+        for angle, c, s in _COMPASS_TICKS:
+            line = QLineF(cx + tick_inner * c, cy + tick_inner * s, cx + tick_outer * c, cy + tick_outer * s)
+            (major_lines if angle % 90 == 0 else minor_lines).append(line)
+
+        # One drawLines() per pen instead of a setPen/drawLine per tick
+        painter.setPen(self._tick_pen)
+        painter.drawLines(minor_lines)
+        painter.setPen(self._major_tick_pen)  # longer cardinal ticks
+        painter.drawLines(major_lines)
+
+        painter.setPen(self._label_color)
+        for angle, c, s in _COMPASS_TICKS:
+            if angle % 90:
+                continue
+            label = {0: "N", 90: "E", 180: "S", 270: "W"}[angle]
+            tx = cx + text_radius * c
+            ty = cy + text_radius * s
+            painter.drawText(
+                int(tx - 15),
+                int(ty - 15),
+                30,
+                30,
+                Qt.AlignmentFlag.AlignCenter,
+                label,
+            )
+
+        painter.end()
+        return pm
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+
+        side = min(self.width(), self.height())
+        center = QPointF(self.width() / 2, self.height() / 2)
+        outer_radius = (side / 2) * 0.95
+
+        is_light = self._is_light
+
+        if self._static_overlay is None:
+            self._static_overlay = self._build_static_overlay()
+        painter.drawPixmap(0, 0, self._static_overlay)
 
         # Pointer
         if not self._pointer.isNull():
@@ -193,15 +252,13 @@ class CompassWidget(QWidget):
             painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
 
             # place near center, like a HUD label
-            font = QFont(self.font().family(), 10)
-            font.setBold(True)
-            painter.setFont(font)
+            painter.setFont(self._status_font)
 
             # subtle opacity in light mode (your request)
             painter.setOpacity(0.22 if is_light else 0.55)
 
             # Use a neutral dark text in light mode; light text in dark mode
-            painter.setPen(QColor(0, 0, 0, 220) if is_light else QColor(255, 255, 255, 230))
+            painter.setPen(self._status_color)
 
             box = QRectF(
                 center.x() - outer_radius * 0.60,
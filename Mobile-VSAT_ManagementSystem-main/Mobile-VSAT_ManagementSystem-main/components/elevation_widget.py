@@ -1,11 +1,17 @@
 import math
 import os
-from PySide6.QtCore import Qt, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF, QLineF, QEvent
 from PySide6.QtGui import QPainter, QColor, QFont, QPen, QPixmap
 from PySide6.QtWidgets import QWidget
 
 from components.utils import resource_path
 
+# (angle, cos, sin) for the 0..90° ticks, measured from the left horizon
+_ELEVATION_TICKS = tuple(
+    (a, math.cos(math.radians(180 - a)), math.sin(math.radians(180 - a)))
+    for a in range(0, 91, 15)
+)
+
 
 class ElevationWidget(QWidget):
     """
@@ -46,6 +52,8 @@ class ElevationWidget(QWidget):
                     self._ruler = pm
                     break
 
+        self._refresh_theme()
+
     def set_elevation(self, elevation: float):
         elevation = float(elevation)
         if self._elevation != elevation:
@@ -72,6 +80,26 @@ class ElevationWidget(QWidget):
         bg = self.palette().color(self.backgroundRole())
         return bg.value() >= 160
 
+    def _refresh_theme(self):
+        is_light = self._is_light_mode()
+        self._is_light = is_light
+        self._arc_pen = QPen(QColor(0, 0, 0, 35) if is_light else QColor(255, 255, 255, 45), 2)
+        self._tick_pen = QPen(QColor(0, 0, 0, 70) if is_light else QColor(255, 255, 255, 80), 1)
+        self._text_color = QColor(0, 0, 0, 180) if is_light else QColor(255, 255, 255, 200)
+        self._hub_color = QColor(0, 0, 0, 190) if is_light else QColor(255, 255, 255, 200)
+        self._status_color = QColor(0, 0, 0, 220) if is_light else QColor(255, 255, 255, 230)
+
+        family = self.font().family()
+        self._label_font = QFont(family, 8)
+        self._status_font = QFont(family, 9)
+        self._status_font.setBold(True)
+
+    def changeEvent(self, event):
+        # Pens/fonts only depend on palette + font, so rebuild them only when those change
+        if event.type() in (QEvent.Type.PaletteChange, QEvent.Type.StyleChange, QEvent.Type.FontChange):
+            self._refresh_theme()
+        super().changeEvent(event)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -88,11 +116,7 @@ class ElevationWidget(QWidget):
         center = QPointF(width / 2, top_left.y() + gauge_size / 2)
         radius = gauge_size / 2
 
-        is_light = self._is_light_mode()
-
-        arc_pen = QPen(QColor(0, 0, 0, 35) if is_light else QColor(255, 255, 255, 45), 2)
-        tick_pen = QPen(QColor(0, 0, 0, 70) if is_light else QColor(255, 255, 255, 80), 1)
-        text_color = QColor(0, 0, 0, 180) if is_light else QColor(255, 255, 255, 200)
+        is_light = self._is_light
 
         # Optional ruler overlay image
         if not self._ruler.isNull():
@@ -103,32 +127,30 @@ class ElevationWidget(QWidget):
             painter.restore()
 
         # Semi-circle arc
-        painter.setPen(arc_pen)
+        painter.setPen(self._arc_pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawChord(top_left.x(), top_left.y(), gauge_size, gauge_size, 0 * 16, 180 * 16)
 
         # Ticks + labels
-        painter.setPen(tick_pen)
-        font = QFont(self.font().family(), 8)
-        painter.setFont(font)
-
-        for angle in range(0, 91, 15):
-            rad = math.radians(180 - angle)
-            x1 = center.x() + radius * math.cos(rad)
-            y1 = center.y() - radius * math.sin(rad)
+        painter.setPen(self._tick_pen)
+        painter.setFont(self._label_font)
 
+        cx, cy = center.x(), center.y()
+        lines = []
+        for angle, c, s in _ELEVATION_TICKS:
             tick_len = 10 if angle % 45 == 0 else 6
-            x2 = center.x() + (radius - tick_len) * math.cos(rad)
-            y2 = center.y() - (radius - tick_len) * math.sin(rad)
-
-            painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
-
+            lines.append(QLineF(
+                cx + radius * c, cy - radius * s,
+                cx + (radius - tick_len) * c, cy - (radius - tick_len) * s,
+            ))
+        painter.drawLines(lines)
+
+        painter.setPen(self._text_color)
+        for angle, c, s in _ELEVATION_TICKS:
             if angle % 45 == 0:
-                painter.setPen(text_color)
-                lx = center.x() + (radius + 12) * math.cos(rad)
-                ly = center.y() - (radius + 12) * math.sin(rad)
+                lx = cx + (radius + 12) * c
+                ly = cy - (radius + 12) * s
                 painter.drawText(int(lx - 10), int(ly - 6), 20, 12, Qt.AlignmentFlag.AlignCenter, str(angle))
-                painter.setPen(tick_pen)
 
         # Needle
         needle_len = radius * 0.90
@@ -139,7 +161,7 @@ class ElevationWidget(QWidget):
         painter.setPen(QPen(QColor("red"), 3, Qt.PenStyle.SolidLine))
         painter.drawLine(center, QPointF(end_x, end_y))
 
-        painter.setBrush(QColor(0, 0, 0, 190) if is_light else QColor(255, 255, 255, 200))
+        painter.setBrush(self._hub_color)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawEllipse(center, 4, 4)
 
@@ -148,12 +170,10 @@ class ElevationWidget(QWidget):
             painter.save()
             painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
 
-            font2 = QFont(self.font().family(), 9)
-            font2.setBold(True)
-            painter.setFont(font2)
+            painter.setFont(self._status_font)
 
             painter.setOpacity(0.22 if is_light else 0.55)
-            painter.setPen(QColor(0, 0, 0, 220) if is_light else QColor(255, 255, 255, 230))
+            painter.setPen(self._status_color)
 
             box = QRectF(0, height * 0.62, width, 22)
             painter.drawText(box, Qt.AlignmentFlag.AlignCenter, self._status_text)
@@ -1,12 +1,18 @@
 import math
 import os
 
-from PySide6.QtCore import Qt, QPointF, QRectF, QSize
+from PySide6.QtCore import Qt, QPointF, QRectF, QSize, QLineF, QEvent
 from PySide6.QtGui import QPainter, QColor, QFont, QPen, QPixmap
 from PySide6.QtWidgets import QWidget
 
 from components.utils import resource_path
 
+# (angle, cos, sin) for every 15° tick, 0° at the top
+_POLAR_TICKS = tuple(
+    (a, math.cos(math.radians(a - 90)), math.sin(math.radians(a - 90)))
+    for a in range(0, 360, 15)
+)
+
 
 class PolarWidget(QWidget):
     """
@@ -38,6 +44,8 @@ class PolarWidget(QWidget):
                     self._ruler = pm
                     break
 
+        self._refresh_theme()
+
     def set_polar(self, polar: float):
         polar = float(polar) % 360.0
         if self._polar != polar:
@@ -48,6 +56,26 @@ class PolarWidget(QWidget):
         bg = self.palette().color(self.backgroundRole())
         return bg.value() >= 160
 
+    def _refresh_theme(self):
+        is_light = self._is_light_mode()
+        self._is_light = is_light
+        self._ring_pen = QPen(QColor(0, 0, 0, 35) if is_light else QColor(255, 255, 255, 45), 2)
+        self._tick_pen = QPen(QColor(0, 0, 0, 70) if is_light else QColor(255, 255, 255, 80), 1)
+        self._major_tick_pen = QPen(self._tick_pen.color(), 2)
+        self._needle_pen = QPen(QColor(0, 120, 255, 200) if is_light else QColor(0, 255, 160, 220), 3)
+        self._hub_color = QColor(0, 0, 0, 160) if is_light else QColor(255, 255, 255, 200)
+        self._text_color = QColor(0, 0, 0, 180) if is_light else QColor(255, 255, 255, 210)
+
+        family = self.font().family()
+        self._caption_font = QFont(family, 9)
+        self._value_font = QFont(family, 10, QFont.Bold)
+
+    def changeEvent(self, event):
+        # Pens/fonts only depend on palette + font, so rebuild them only when those change
+        if event.type() in (QEvent.Type.PaletteChange, QEvent.Type.StyleChange, QEvent.Type.FontChange):
+            self._refresh_theme()
+        super().changeEvent(event)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -60,11 +88,7 @@ class PolarWidget(QWidget):
         center = QPointF(w / 2, h / 2)
         radius = (side / 2) * 0.90
 
-        is_light = self._is_light_mode()
-
-        ring_pen = QPen(QColor(0, 0, 0, 35) if is_light else QColor(255, 255, 255, 45), 2)
-        tick_pen = QPen(QColor(0, 0, 0, 70) if is_light else QColor(255, 255, 255, 80), 1)
-        text_color = QColor(0, 0, 0, 180) if is_light else QColor(255, 255, 255, 210)
+        is_light = self._is_light
 
         # Optional ruler overlay
         if not self._ruler.isNull():
@@ -75,28 +99,25 @@ class PolarWidget(QWidget):
             painter.restore()
 
         # Outer ring
-        painter.setPen(ring_pen)
+        painter.setPen(self._ring_pen)
         painter.setBrush(Qt.NoBrush)
         painter.drawEllipse(center, radius, radius)
 
         # Ticks
-        painter.setPen(tick_pen)
+        painter.setPen(self._tick_pen)
         tick_outer = radius * 0.98
         tick_inner = radius * 0.90
 
-        for deg in range(0, 360, 15):
-            rad = math.radians(deg - 90)
-            x1 = center.x() + tick_inner * math.cos(rad)
-            y1 = center.y() + tick_inner * math.sin(rad)
-            x2 = center.x() + tick_outer * math.cos(rad)
-            y2 = center.y() + tick_outer * math.sin(rad)
+        cx, cy = center.x(), center.y()
+        minor_lines = []
+        major_lines = []
+        for deg, c, s in _POLAR_TICKS:
+            line = QLineF(cx + tick_inner * c, cy + tick_inner * s, cx + tick_outer * c, cy + tick_outer * s)
+            (major_lines if deg % 90 == 0 else minor_lines).append(line)
 
-            if deg % 90 == 0:
-                painter.setPen(QPen(tick_pen.color(), 2))
-                painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
-                painter.setPen(tick_pen)
-            else:
-                painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+        painter.drawLines(minor_lines)
+        painter.setPen(self._major_tick_pen)
+        painter.drawLines(major_lines)
 
         # Needle
         needle_len = radius * 0.85
@@ -106,17 +127,17 @@ class PolarWidget(QWidget):
             center.y() + needle_len * math.sin(rad),
         )
 
-        painter.setPen(QPen(QColor(0, 120, 255, 200) if is_light else QColor(0, 255, 160, 220), 3))
+        painter.setPen(self._needle_pen)
         painter.drawLine(center, end)
 
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(0, 0, 0, 160) if is_light else QColor(255, 255, 255, 200))
+        painter.setBrush(self._hub_color)
         painter.drawEllipse(center, 4, 4)
 
         # Center label/value
-        painter.setPen(text_color)
-        painter.setFont(QFont(self.font().family(), 9))
+        painter.setPen(self._text_color)
+        painter.setFont(self._caption_font)
         painter.drawText(0, int(h * 0.55), w, 18, Qt.AlignCenter, "Polar")
 
-        painter.setFont(QFont(self.font().family(), 10, QFont.Bold))
+        painter.setFont(self._value_font)
         painter.drawText(0, int(h * 0.65), w, 22, Qt.AlignCenter, f"{self._polar:.2f}°")
@@ -1,14 +1,29 @@
 # components/signal_gauge.py
 from __future__ import annotations
 import math
-from PySide6.QtCore import Qt, QRectF, QPointF, Property
-from PySide6.QtGui import QPainter, QPen, QFont, QColor, QLinearGradient, QBrush, QPolygonF
+from PySide6.QtCore import Qt, QPoint, QRect, QRectF, Property, QEvent, QTimer
+from PySide6.QtGui import QPainter, QPainterPath, QPen, QFont, QFontMetrics, QColor, QLinearGradient, QBrush, QPolygonF
 from PySide6.QtWidgets import QWidget
 
+def _tick_directions(ticks, min_v, max_v, start_deg, span_deg):
+    """Unit (x, y) label directions per tick."""
+    dirs_x, dirs_y = [], []
+    for t in ticks:
+        tr = 0.0 if max_v <= min_v else (t - min_v) / (max_v - min_v)
+        tr = max(0.0, min(1.0, tr))
+        a = math.radians(start_deg + span_deg * tr)
+        dirs_x.append(-math.sin(a))
+        dirs_y.append(-math.cos(a))
+    return dirs_x, dirs_y
+
+
 class GaugeWidget(QWidget):
     """
     Semicircle gauge with progress arc, tick labels, center readout, and a small pointer wedge.
     """
+    START_DEG = 225
+    SPAN_DEG = -270
+
     def __init__(self, min_value=0.0, max_value=100.0, value=0.0, unit="", tick_labels=None, parent=None):
         super().__init__(parent)
         self._min = float(min_value)
@@ -16,7 +31,10 @@ class GaugeWidget(QWidget):
         self._value = float(value)
         self._unit = unit
         self._ticks = list(tick_labels) if tick_labels else []
+        self._build_tick_table()
         self.setMinimumSize(220, 160)
+        # paintEvent fills every pixel itself, so Qt can skip erasing the background first
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
 
         # Colors
         self.bg_color = QColor("#f8f9fa")
@@ -26,15 +44,116 @@ class GaugeWidget(QWidget):
         self.text_color = QColor("#000000")
         self.subtle = QColor("#8a8a92")
 
+        # What's actually on screen: only repaint when one of these changes
+        self._last_sweep = self._sweep_for(self._value)
+        self._last_text = f"{self._value:.2f}"
+
+        # Coalesce bursts to at most one repaint per ~16 ms (60 Hz); owned by the widget,
+        # so it can't fire after the gauge is gone
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self.update)
+
+        self._update_geometry()
+
+    def _build_tick_table(self):
+        """Ticks/min/max are fixed, so the label directions + texts are computed once."""
+        xs, ys = _tick_directions(self._ticks, self._min, self._max, self.START_DEG, self.SPAN_DEG)
+        texts = [f"{int(t) if float(t).is_integer() else t}" for t in self._ticks]
+        self._tick_table = list(zip(xs, ys, texts))
+
+    def _update_geometry(self):
+        """
+        Everything that only depends on size/font/colors: geometry, fonts and pens.
+        Recomputed on resize (and font change) instead of every paint.
+        """
+        w, h = self.width(), self.height()
+        side = min(w, h * 1.25)
+        cx, cy = w / 2.0, h * 0.9
+        self._center = (cx, cy)
+
+        radius = side * 0.42
+        thickness = radius * 0.18
+        self._radius = radius
+        self._thickness = thickness
+
+        self._rect = QRectF(cx - radius, cy - radius, 2 * radius, 2 * radius)
+        self._value_rect = QRectF(cx - radius * 0.8, cy - radius * 0.45, radius * 1.6, radius * 0.5)
+        self._unit_rect = QRectF(cx - radius * 0.8, cy - radius * 0.15, radius * 1.6, radius * 0.4)
+
+        self._small_font = QFont(self.font())
+        self._small_font.setPointSizeF(max(8.0, radius * 0.11))
+        self._value_font = QFont(self.font())
+        self._value_font.setBold(True)
+        self._value_font.setPointSizeF(max(12.0, radius * 0.22))
+        self._unit_font = QFont(self.font())
+        self._unit_font.setPointSizeF(max(9.0, radius * 0.12))
+
+        # Tick label boxes only depend on the small font + geometry: measure and place them once here
+        fm = QFontMetrics(self._small_font)
+        r_label = radius + thickness * 0.35
+        self._tick_rects = []
+        for ux, uy, text in self._tick_table:
+            br = fm.boundingRect(QRect(0, 0, 1000, 1000), Qt.AlignCenter, text)
+            # integer centre straight away (round like QPointF.toPoint, without the temporaries)
+            br.moveCenter(QPoint(int(cx + r_label * ux + 0.5), int(cy + r_label * uy + 0.5)))
+            self._tick_rects.append((br, text))
+
+        self._track_pen = QPen(self.arc_bg, thickness, Qt.SolidLine, Qt.FlatCap)
+        self._progress_pen = QPen(self.arc_fg_1, thickness, Qt.SolidLine, Qt.FlatCap)
+        self._pen_subtle = QPen(self.subtle)
+        self._pen_text = QPen(self.text_color)
+
+        # Arc geometry as paths: the track never changes, progress is rebuilt per sweep
+        self._track_path = self._arc_path(self.SPAN_DEG)
+        self._progress_cache = None  # (sweep, QPainterPath)
+
+    def _arc_path(self, sweep_deg: float) -> QPainterPath:
+        path = QPainterPath()
+        path.arcMoveTo(self._rect, self.START_DEG)
+        path.arcTo(self._rect, self.START_DEG, sweep_deg)
+        return path
+
+    def _progress_path(self, sweep: int) -> QPainterPath:
+        if self._progress_cache is None or self._progress_cache[0] != sweep:
+            self._progress_cache = (sweep, self._arc_path(sweep))
+        return self._progress_cache[1]
+
+    def resizeEvent(self, event):
+        self._update_geometry()
+        super().resizeEvent(event)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.FontChange:
+            self._update_geometry()
+        super().changeEvent(event)
+
     # Property so you can animate later if you want
     def getValue(self) -> float:
         return self._value
 
+    def _sweep_for(self, v: float) -> int:
+        ratio = 0.0 if self._max <= self._min else (v - self._min) / (self._max - self._min)
+        ratio = max(0.0, min(1.0, ratio))
+        return int(self.SPAN_DEG * ratio)
+
     def setValue(self, v: float):
         v = max(self._min, min(self._max, float(v)))
-        if v != self._value:
-            self._value = v
-            self.update()
+        if v == self._value:
+            return
+        self._value = v
+
+        # Noisy telemetry: skip repaints that wouldn't change the arc or the readout
+        sweep = self._sweep_for(v)
+        text = f"{v:.2f}"
+        if sweep == self._last_sweep and text == self._last_text:
+            return
+        self._last_sweep = sweep
+        self._last_text = text
+
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
 
     value = Property(float, fget=getValue, fset=setValue)
 
@@ -42,69 +161,38 @@ class GaugeWidget(QWidget):
         return self.minimumSize()
 
     def paintEvent(self, _):
-        w, h = self.width(), self.height()
-        side = min(w, h * 1.25)
-        cx, cy = w / 2.0, h * 0.9
-
-        radius = side * 0.42
-        thickness = radius * 0.18
-
-        start_deg = 225
-        span_deg = -270
-
         p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing, True)
+        # Axis-aligned background needs no AA; arcs + labels do
         p.fillRect(self.rect(), self.bg_color)
-
-        rect = QRectF(cx - radius, cy - radius, 2 * radius, 2 * radius)
+        p.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
 
         # Track
-        p.setPen(QPen(self.arc_bg, thickness, Qt.SolidLine, Qt.FlatCap))
-        p.drawArc(rect, start_deg * 16, span_deg * 16)
+        p.strokePath(self._track_path, self._track_pen)
 
         # Progress
-        ratio = 0.0 if self._max <= self._min else (self._value - self._min) / (self._max - self._min)
-        ratio = max(0.0, min(1.0, ratio))
-        sweep = int(span_deg * ratio)
+        sweep = self._last_sweep
 
         # << MODIFICATION 1: Use a solid color instead of a gradient >>
         # grad = QLinearGradient(rect.topLeft(), rect.bottomRight())
         # grad.setColorAt(0.0, self.arc_fg_1)
         # grad.setColorAt(1.0, self.arc_fg_2)
         # p.setPen(QPen(QBrush(grad), thickness, Qt.SolidLine, Qt.FlatCap))
-        p.setPen(QPen(self.arc_fg_1, thickness, Qt.SolidLine, Qt.FlatCap)) # Use the primary foreground color
-        p.drawArc(rect, start_deg * 16, sweep * 16)
+        if sweep:
+            p.strokePath(self._progress_path(sweep), self._progress_pen) # Use the primary foreground color
 
         if self._ticks:
-            p.setPen(self.subtle)
-            font_small = QFont(self.font())
-            font_small.setPointSizeF(max(8.0, radius * 0.11))
-            p.setFont(font_small)
-            for t in self._ticks:
-                tr = 0.0 if self._max <= self._min else (t - self._min) / (self._max - self._min)
-                tr = max(0.0, min(1.0, tr))
-                a = math.radians(start_deg + span_deg * tr)
-                r_label = radius + thickness * 0.35
-                lx = cx + r_label * -math.sin(a)
-                ly = cy - r_label * math.cos(a)
-                text = f"{int(t) if float(t).is_integer() else t}"
-                br = p.boundingRect(0, 0, 1000, 1000, Qt.AlignCenter, text)
-                br.moveCenter(QPointF(lx, ly).toPoint())
+            p.setPen(self._pen_subtle)
+            p.setFont(self._small_font)
+            for br, text in self._tick_rects:
                 p.drawText(br, Qt.AlignCenter, text)
 
-        p.setPen(self.text_color)
-        value_font = QFont(self.font()); value_font.setBold(True)
-        value_font.setPointSizeF(max(12.0, radius * 0.22))
-        p.setFont(value_font)
-        value_rect = QRectF(cx - radius * 0.8, cy - radius * 0.45, radius * 1.6, radius * 0.5)
-        p.drawText(value_rect, Qt.AlignCenter, f"{self._value:.2f}")
+        p.setPen(self._pen_text)
+        p.setFont(self._value_font)
+        p.drawText(self._value_rect, Qt.AlignCenter, self._last_text)
 
         if self._unit:
-            unit_font = QFont(self.font())
-            unit_font.setPointSizeF(max(9.0, radius * 0.12))
-            p.setFont(unit_font)
-            unit_rect = QRectF(cx - radius * 0.8, cy - radius * 0.15, radius * 1.6, radius * 0.4)
-            p.setPen(self.subtle)
-            p.drawText(unit_rect, Qt.AlignCenter, self._unit)
+            p.setFont(self._unit_font)
+            p.setPen(self._pen_subtle)
+            p.drawText(self._unit_rect, Qt.AlignCenter, self._unit)
 
         p.end()
@@ -1,7 +1,10 @@
 # components/utils.py
 import os
 import sys
+from functools import lru_cache
+
 from PySide6.QtCore import QUrl
+from PySide6.QtGui import QIcon, QPixmap, QPixmapCache
 
 
 def _project_root() -> str:
@@ -14,15 +17,16 @@ def _project_root() -> str:
     return root
 
 
+# Resolved once: PyInstaller sets _MEIPASS before any of our code runs
+_BASE_PATH = getattr(sys, "_MEIPASS", None) or _project_root()
+
+
+@lru_cache(maxsize=512)
 def resource_path(relative_path: str) -> str:
     """
     Works in dev (python main.py) and in PyInstaller builds.
     """
-    base_path = getattr(sys, "_MEIPASS", None)
-    if base_path:
-        return os.path.join(base_path, relative_path)
-
-    return os.path.join(_project_root(), relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
 
 
 def resource_url(relative_path: str) -> str:
@@ -31,3 +35,27 @@ def resource_url(relative_path: str) -> str:
     Handles Windows paths correctly.
     """
     return QUrl.fromLocalFile(resource_path(relative_path)).toString()
+
+
+@lru_cache(maxsize=None)
+def cached_icon(relative_path: str) -> QIcon:
+    """
+    Shared QIcon per asset, so each icon file is read/decoded once per process.
+    Only call after QApplication exists.
+    """
+    abs_path = resource_path(relative_path)
+    if relative_path.lower().endswith(".ico"):
+        return QIcon(abs_path)  # keep every size stored in the .ico
+
+    pm = QPixmapCache.find(relative_path)
+    if pm is None or pm.isNull():
+        pm = QPixmap(abs_path)
+        if pm.isNull():
+            return QIcon(abs_path)
+        QPixmapCache.insert(relative_path, pm)
+
+    # Explicit off/on pixmaps: checkable nav buttons toggle without Qt deriving variants
+    icon = QIcon()
+    icon.addPixmap(pm, QIcon.Mode.Normal, QIcon.State.Off)
+    icon.addPixmap(pm, QIcon.Mode.Normal, QIcon.State.On)
+    return icon
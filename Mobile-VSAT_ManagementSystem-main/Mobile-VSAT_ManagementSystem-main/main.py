@@ -1,91 +1,168 @@
+import importlib
 import os
 import sys
-import re
 
-from PySide6.QtCore import Slot, Qt, QSize
-from PySide6.QtGui import QIcon, QColor, QPalette, QPixmap, QImageReader
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot, Qt, QSize
+from PySide6.QtGui import QColor, QPalette, QPixmap, QImageReader
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget,
     QHBoxLayout, QVBoxLayout, QPushButton, QStackedWidget, QButtonGroup,
     QSizePolicy, QLabel
 )
 
-from views.dashboard import DashboardView
-from views.acu_native import AcuNativeView
-from views.modem_webview import ModemView
-from views.voip_webview import VoipView
-from views.helpPage import HelpPage
+from components.utils import resource_path, resource_url, cached_icon
 
-from components.utils import resource_path, resource_url
+
+def _noop() -> None:
+    pass
+
+
+# Qt resources, inline data and remote URLs are left untouched
+_QSS_URL_KEEP = (":", "data:", "http://", "https://")
+
+
+def _rewrite_qss_url(inner: str) -> str:
+    raw = inner.strip()
+
+    # strip quotes if present (only a matching pair)
+    if raw[:1] in ("\"", "'") and raw.endswith(raw[0]):
+        raw = raw[1:-1].strip()
+
+    if raw.startswith(_QSS_URL_KEEP):
+        return f"url({inner})"
+
+    # Already a file URL
+    if raw.startswith("file:"):
+        return f"url({raw})"
+
+    # Everything else: treat as project-relative path
+    return f"url({resource_url(raw)})"
 
 
 def _resolve_qss_urls(qss_text: str) -> str:
     """
     Qt resolves relative url(...) paths in stylesheets relative to the *process working directory*,
     not relative to the .qss file location. This rewrites url(relative.png) -> url(file:///ABS.png).
+    Single pass with str.find (same matches as the old r"url\(([^)]+)\)" regex).
     """
-    def repl(match: re.Match) -> str:
-        raw = (match.group(1) or "").strip()
+    out = []
+    i = 0
+    while True:
+        j = qss_text.find("url(", i)
+        if j < 0:
+            break
+        k = qss_text.find(")", j + 4)
+        if k < 0:
+            break
+        if k == j + 4:  # "url()": nothing to rewrite
+            out.append(qss_text[i:k + 1])
+        else:
+            out.append(qss_text[i:j])
+            out.append(_rewrite_qss_url(qss_text[j + 4:k]))
+        i = k + 1
+    out.append(qss_text[i:])
+    return "".join(out)
+
+
+# Verbose asset audit (image format list); off by default, stripped under python -O
+AUDIT_VERBOSE = False
 
-        # strip quotes if present
-        if (raw.startswith('"') and raw.endswith('"')) or (raw.startswith("'") and raw.endswith("'")):
-            raw = raw[1:-1].strip()
 
-        # Leave these untouched
-        if raw.startswith(":") or raw.startswith("data:") or raw.startswith("http://") or raw.startswith("https://"):
-            return f"url({match.group(1)})"
+_AUDIT_ASSETS = [
+    "assets/Dashboard.png",
+    "assets/ACU.png",
+    "assets/Modem.png",
+    "assets/voip.png",
+    "assets/help.png",
+    "assets/back.png",
+    "assets/forward.png",
+    "assets/refresh.png",
+    "assets/app_icon.ico",
+    # only if you actually have this file:
+    "assets/compass_background.webp",
+]
 
-        # Already a file URL
-        if raw.startswith("file:"):
-            return f"url({raw})"
+# File signatures, enough to tell "real image" from "empty/garbage" without decoding
+_IMAGE_MAGIC = {
+    ".png": (b"\x89PNG\r\n\x1a\n",),
+    ".ico": (b"\x00\x00\x01\x00",),
+    ".webp": (b"RIFF",),
+}
 
-        # Everything else: treat as project-relative path
-        return f"url({resource_url(raw)})"
 
-    return re.sub(r"url\(([^)]+)\)", repl, qss_text)
+class _AuditSignals(QObject):
+    missing = Signal(list)  # rel paths that are missing or unreadable
 
 
-def audit_assets() -> None:
+class _AuditRunner(QRunnable):
+    """Filesystem-only asset check (no QPixmap/QIcon) so it can run off the GUI thread."""
+
+    def __init__(self, signals: _AuditSignals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        # One directory listing per folder instead of a stat() per file
+        listings: dict[str, set[str]] = {}
+        for rel in _AUDIT_ASSETS:
+            folder = os.path.dirname(rel)
+            if folder not in listings:
+                try:
+                    with os.scandir(resource_path(folder)) as it:
+                        listings[folder] = {e.name for e in it}
+                except OSError:
+                    listings[folder] = set()
+
+        bad = []
+        for rel in _AUDIT_ASSETS:
+            abs_path = resource_path(rel)
+            exists = os.path.basename(rel) in listings[os.path.dirname(rel)]
+
+            # Only probe if file exists (prevents noise); 8 header bytes, no pixel decode
+            readable = False
+            if exists:
+                try:
+                    with open(abs_path, "rb") as f:
+                        head = f.read(8)
+                    magic = _IMAGE_MAGIC.get(os.path.splitext(rel)[1].lower(), ())
+                    readable = not magic or head.startswith(magic)
+                except OSError:
+                    pass
+
+            print(f"{rel}")
+            print(f"  path: {abs_path}")
+            print(f"  exists: {exists}")
+            print(f"  readable: {readable}")
+            if not readable:
+                bad.append(rel)
+
+        if bad:
+            self.signals.missing.emit(bad)
+
+
+def audit_assets(on_missing=None) -> None:
     """
     Debug helper: must be called AFTER QApplication is created.
+    Does nothing unless MVMS_AUDIT is set in the environment (and never under python -O).
+    The file checks run on the global QThreadPool; on_missing(list) is called on the GUI
+    thread only if something is missing.
     """
-# Commented out verbose asset audit
-#     print("\n=== MVMS ASSET AUDIT ===")
-#     fmts = [bytes(x).decode(errors="ignore") for x in QImageReader.supportedImageFormats()]
-#     print("Supported image formats:", fmts)
-
-    must_exist = [
-        "assets/Dashboard.png",
-        "assets/ACU.png",
-        "assets/Modem.png",
-        "assets/voip.png",
-        "assets/help.png",
-        "assets/back.png",
-        "assets/forward.png",
-        "assets/refresh.png",
-        "assets/app_icon.ico",
-        # only if you actually have this file:
-        "assets/compass_background.webp",
-    ]
+    if sys.flags.optimize or not os.environ.get("MVMS_AUDIT"):
+        return
 
-    for rel in must_exist:
-        abs_path = resource_path(rel)
-        exists = os.path.exists(abs_path)
+    if __debug__ and AUDIT_VERBOSE:
+        print("\n=== MVMS ASSET AUDIT ===")
+        fmts = [x.data().decode("ascii", "ignore") for x in QImageReader.supportedImageFormats()]
+        print("Supported image formats:", fmts)
 
-        # Only attempt to load if file exists (prevents noise)
-        if exists:
-            icon = QIcon(abs_path)
-            pix = QPixmap(abs_path)
-            ok_icon = not icon.isNull()
-            ok_pix = not pix.isNull()
-        else:
-            ok_icon = False
-            ok_pix = False
+    global _audit_signals
+    _audit_signals = _AuditSignals()  # lives on the GUI thread, so slots run there
+    if on_missing is not None:
+        _audit_signals.missing.connect(on_missing)
+    QThreadPool.globalInstance().start(_AuditRunner(_audit_signals))
 
-        print(f"{rel}")
-        print(f"  path: {abs_path}")
-        print(f"  exists: {exists}")
-        print(f"  QIcon ok: {ok_icon} | QPixmap ok: {ok_pix}")
+
+_audit_signals: _AuditSignals | None = None
 
 
 class NavButton(QPushButton):
@@ -95,29 +172,29 @@ class NavButton(QPushButton):
         self.setCheckable(True)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
-        self.setIcon(QIcon(resource_path(icon_path)))
+        self.setIcon(cached_icon(icon_path))
         self.setIconSize(QSize(20, 20))
 
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.setMinimumHeight(44)
-        self.setStyleSheet("text-align: left; padding-left: 12px;")
-        self.setIconSize(QSize(20, 20))
-        
-        self.setStyleSheet("text-align: left; padding-left: 12px;")
+        # text-align/padding come from #NavContainer QPushButton#NavButton in mainStyle.qss
         self.setLayoutDirection(Qt.LeftToRight)
 
 
 class MainWindow(QMainWindow):
     """The main application window."""
 
-    # (Button Text, Icon Path, View Class)
+    # (Button Text, Icon Path, "module:ViewClass")
+    # Views are imported + built on first visit (QtWebEngine pages are expensive to start)
     PAGES = [
-        ("Dashboard",      "assets/Dashboard.png", DashboardView),
-        ("ACU Settings",   "assets/ACU.png",       AcuNativeView),
-        ("Modem Settings", "assets/Modem.png",     ModemView),
-        ("VoIP Settings",  "assets/voip.png",      VoipView),
-        ("Help",           "assets/help.png",      HelpPage),
+        ("Dashboard",      "assets/Dashboard.png", "views.dashboard:DashboardView"),
+        ("ACU Settings",   "assets/ACU.png",       "views.acu_native:AcuNativeView"),
+        ("Modem Settings", "assets/Modem.png",     "views.modem_webview:ModemView"),
+        ("VoIP Settings",  "assets/voip.png",      "views.voip_webview:VoipView"),
+        ("Help",           "assets/help.png",      "views.helpPage:HelpPage"),
     ]
+    DASHBOARD_PAGE = 0
+    ACU_PAGE = 1
 
     def __init__(self):
         super().__init__()
@@ -133,17 +210,8 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
 
         # App icon
-        self.setWindowIcon(QIcon(resource_path("assets/app_icon.ico")))
+        self.setWindowIcon(cached_icon("assets/app_icon.ico"))
 
-        # Load stylesheet and fix url(...) paths
-        stylesheet_path = resource_path("styles/mainStyle.qss")
-        try:
-            with open(stylesheet_path, "r", encoding="utf-8") as f:
-                qss = f.read()
-            qss = _resolve_qss_urls(qss)
-            self.setStyleSheet(qss)
-        except FileNotFoundError:
-            print("Warning: stylesheet 'styles/mainStyle.qss' not found.")
 
     def _init_ui(self):
         central_widget = QWidget()
@@ -212,48 +280,78 @@ class MainWindow(QMainWindow):
     def _create_main_content(self) -> QStackedWidget:
         stacked = QStackedWidget()
         
-        # Create view instances and store references
+        # Key view references (filled in as the views get built)
         self.dashboard_view = None
         self.acu_view = None
+        self._view_cache: dict[int, QWidget] = {}
+        self._telemetry_linked = False
+
+        # Page lifecycle hooks, bound once per view (placeholders get no-ops)
+        self._enter_cb = {idx: _noop for idx in range(len(self.PAGES))}
+        self._leave_cb = dict(self._enter_cb)
         
-        for idx, (_, _, view_class) in enumerate(self.PAGES):
-            view = view_class()
-            stacked.addWidget(view)
-            
-            # Store references to key views
-            if idx == 0:  # Dashboard
-                self.dashboard_view = view
-            elif idx == 1:  # ACU Settings
-                self.acu_view = view
+        # Empty placeholders keep stack indices == PAGES indices until a page is visited
+        for _ in self.PAGES:
+            stacked.addWidget(QWidget())
         
-        # ✅ Connect ACU telemetry to Dashboard
-        if self.acu_view and self.dashboard_view:
+        return stacked
+
+    def _ensure_view(self, idx: int) -> QWidget:
+        """Import + construct the page's view on first use and swap it into the stack."""
+        view = self._view_cache.get(idx)
+        if view is not None:
+            return view
+
+        module_name, class_name = self.PAGES[idx][2].split(":")
+        view_class = getattr(importlib.import_module(module_name), class_name)
+        view = view_class()
+
+        placeholder = self.stacked_widget.widget(idx)
+        self.stacked_widget.insertWidget(idx, view)
+        self.stacked_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
+
+        self._view_cache[idx] = view
+        self._on_view_created(idx, view)
+        return view
+
+    def _on_view_created(self, idx: int, view: QWidget):
+        self._enter_cb[idx] = getattr(view, "on_enter", None) or _noop
+        self._leave_cb[idx] = getattr(view, "on_leave", None) or _noop
+
+        # Store references to key views
+        if idx == self.DASHBOARD_PAGE:
+            self.dashboard_view = view
+        elif idx == self.ACU_PAGE:
+            self.acu_view = view
+
+        # ✅ Connect ACU telemetry to Dashboard (once both exist)
+        if self.acu_view and self.dashboard_view and not self._telemetry_linked:
             if hasattr(self.acu_view, 'telemetry_data') and hasattr(self.dashboard_view, '_on_tcp_data'):
                 self.acu_view.telemetry_data.connect(self.dashboard_view._on_tcp_data)
-        
-        return stacked
+                self._telemetry_linked = True
 
     def _connect_signals(self):
         self.button_group.idClicked.connect(self.switch_page)
 
-    def _call_lifecycle(self, widget, method_name: str):
-        if hasattr(widget, method_name):
-            try:
-                getattr(widget, method_name)()
-            except Exception:
-                pass
+    @staticmethod
+    def _call_lifecycle(callback):
+        # A misbehaving page hook must never block navigation
+        try:
+            callback()
+        except Exception:
+            pass
 
     @Slot(int)
     def switch_page(self, idx: int):
-        current = self.stacked_widget.currentWidget()
-        if current:
-            self._call_lifecycle(current, "on_leave")
+        current = self.stacked_widget.currentIndex()
+        if current >= 0:
+            self._call_lifecycle(self._leave_cb[current])
 
+        self._ensure_view(idx)
         self.stacked_widget.setCurrentIndex(idx)
 
-        new = self.stacked_widget.currentWidget()
-        if new:
-            self._call_lifecycle(new, "on_enter")
+        self._call_lifecycle(self._enter_cb[idx])
 
 
     def _on_emergency_stop(self):
@@ -269,14 +367,35 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            # Send stop via ACU view
+            # Send stop via ACU view (never opened = never connected, nothing to stop)
             if hasattr(self, 'acu_view') and self.acu_view:
                 self.acu_view._on_stop()
                 self.statusBar().showMessage("⚠ EMERGENCY STOP SENT", 5000)
+            else:
+                self.statusBar().showMessage("ACU not connected - open ACU Settings to connect", 5000)
+
+
+def _load_stylesheet() -> str | None:
+    """Read mainStyle.qss and fix url(...) paths."""
+    stylesheet_path = resource_path("styles/mainStyle.qss")
+    try:
+        with open(stylesheet_path, "r", encoding="utf-8") as f:
+            qss = f.read()
+    except FileNotFoundError:
+        print("Warning: stylesheet 'styles/mainStyle.qss' not found.")
+        return None
+    return _resolve_qss_urls(qss)
 
 
 def setup_app_style() -> QPalette:
     QApplication.setStyle("Fusion")
+
+    # One application-wide stylesheet (parsed once, shared by every window/dialog).
+    # Widgets get styled via objectName/property selectors, never per-widget setStyleSheet.
+    qss = _load_stylesheet()
+    if qss:
+        QApplication.instance().setStyleSheet(qss)
+
     palette = QPalette()
     palette.setColor(QPalette.ColorRole.Window, QColor(240, 240, 240))
     palette.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.black)
@@ -295,13 +414,16 @@ def setup_app_style() -> QPalette:
 
 
 if __name__ == "__main__":
+    # QtWebEngine views are imported lazily, after QApplication exists; Qt requires
+    # shared GL contexts to be requested up front in that case.
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     app.setPalette(setup_app_style())
 
-    # ✅ Safe: QPixmap/QIcon only after QApplication exists
-    # audit_assets()  # Disabled - too verbose
-
     window = MainWindow()
     window.show()
 
+    # Background asset check (no-op unless MVMS_AUDIT is set)
+    audit_assets(lambda bad: window.statusBar().showMessage(f"Missing assets: {', '.join(bad)}", 10000))
+
     sys.exit(app.exec())
@@ -1,4 +1,5 @@
 import logging
+import threading
 from PySide6.QtCore import QObject, Signal
 
 from services.acu_scraper import (
@@ -21,8 +22,18 @@ class DataWorker(QObject):
         super().__init__()
         self.acu_client = None
         self.uhp_client = None
+        self._busy = threading.Lock()
 
     def run(self):
+        # Coalesce: a poll that fires while another is still in flight is just skipped
+        if not self._busy.acquire(blocking=False):
+            return
+        try:
+            self._run_once()
+        finally:
+            self._busy.release()
+
+    def _run_once(self):
         try:
             # Create scraper client only if enabled
             if SCRAPER_ENABLED:
@@ -59,7 +70,12 @@ class DataWorker(QObject):
 
             self.data_ready.emit(formatted_data)
 
-        except Exception as e:
+        except OSError as e:
+            # Transport failure (ConnectionError/timeouts and requests' exceptions are all OSErrors): reconnect on the next poll
             self.error.emit(f"A critical error occurred in DataWorker: {e}")
             self.acu_client = None
             self.uhp_client = None
+        except Exception as e:
+            # Parse/format problem: the sessions are fine, keep reusing them
+            logging.exception("DataWorker poll failed")
+            self.error.emit(f"A critical error occurred in DataWorker: {e}")
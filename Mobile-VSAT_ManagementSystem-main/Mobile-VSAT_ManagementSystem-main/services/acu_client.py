@@ -1,33 +1,35 @@
 # services/acu_client.py
 from __future__ import annotations
 
+import random
+import re
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 
 from services.acu_tcp import ACUTcp
-from services.acu_driver import build_frame, parse_show, parse_sat, parse_place
+from services.acu_driver import build_frame_bytes, parse_show, parse_sat, parse_place
 
 
-def parse_kv_text(text: str) -> Dict[str, Any]:
+# Constant poll frame, built (and checksummed) once
+_SHOW_FRAME = build_frame_bytes("cmd", "get show")  # matches testingport.py
+
+# One "key=value" per line; lines starting with '$' (e.g. '$show' headers) never match
+_KV = re.compile(r"^(?![^\S\n]*\$)([^=\n]*)=([^\n]*)$", re.M)
+# every line break str.splitlines() knows about, folded to "\n" before _KV runs
+_EOL = re.compile("\r\n|[\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def parse_kv_text(text) -> Dict[str, Any]:
     """
     Parse output:
       key=value
       key=value
-    into dict.
+    into dict (str or raw bytes).
     Ignores header lines like '$show' or empty lines.
     """
-    d: Dict[str, Any] = {}
-    for line in (text or "").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        if line.startswith("$"):
-            continue
-        if "=" not in line:
-            continue
-        k, v = line.split("=", 1)
-        d[k.strip()] = v.strip()
-    return d
+    if isinstance(text, (bytes, bytearray)):
+        text = text.decode("ascii", errors="replace")
+    return {k.strip(): v.strip() for k, v in _KV.findall(_EOL.sub("\n", text or ""))}
 
 
 
@@ -58,13 +60,18 @@ class ACUClient:
         self._tcp.reconnect(timeout=timeout)
 
     # ---------- Low-level send ----------
-    def send_raw(self, frame: str, retries: int = 3, timeout: float = 2.0) -> str:
+    def send_raw(self, frame: Union[str, bytes], retries: int = 3, timeout: float = 2.0) -> str:
         return self._safe_send_and_read(frame, retries=retries, timeout=timeout)
 
-    def _safe_send_and_read(self, frame: str, retries: int, timeout: float) -> str:
+    def _safe_send_and_read(self, frame: Union[str, bytes], retries: int, timeout: float) -> str:
         last_err: Optional[Exception] = None
+        attempts = max(1, retries)
+        delay = 0.01  # exponential backoff: 10 ms, 20 ms, 40 ms ... (+ jitter)
 
-        for _ in range(max(1, retries)):
+        for attempt in range(attempts):
+            gen = self._tcp.generation
+            if self._tcp.closed:
+                raise ConnectionError("ACU disconnected")  # explicit disconnect: don't dial back in
             try:
                 if not self.is_connected():
                     self.connect(timeout=timeout)
@@ -74,13 +81,23 @@ class ACUClient:
                     raise TimeoutError("Empty response")
                 return resp
 
+            except TimeoutError as e:
+                # ACU is slow, the socket itself is fine: back off, don't reconnect
+                last_err = e
             except Exception as e:
                 last_err = e
                 try:
-                    self.reconnect(timeout=timeout)
+                    # skipped if another thread already replaced the socket
+                    self._tcp.reconnect_if_stale(gen, timeout=timeout)
                 except Exception:
                     pass
-                time.sleep(0.1)
+                # Fresh socket: first retry goes straight out
+                if attempt == 0:
+                    continue
+
+            if attempt + 1 < attempts:
+                time.sleep(delay + random.random() * 0.01)
+                delay *= 2
 
         raise last_err if last_err else TimeoutError("No response")
 
@@ -92,8 +109,7 @@ class ACUClient:
         - Mock server: key=value lines -> parse_kv_text(...)
         """
         # ✅ FIX: Use correct ACU command format (matches testingport.py)
-        frame = build_frame("cmd", "get show")  # Changed from ("show", "1")
-        resp = self._safe_send_and_read(frame, retries=retries, timeout=timeout)
+        resp = self._safe_send_and_read(_SHOW_FRAME, retries=retries, timeout=timeout)  # Changed from ("show", "1")
 
         # If mock server output contains "key=value", parse that
         if "=" in resp and "$show" not in resp:
@@ -119,7 +135,7 @@ class ACUClient:
         retries: int = 2,
         timeout: float = 2.0,
     ) -> Dict[str, Any]:
-        frame = build_frame("cmd", "sat", name, center_freq, carrier_freq, carrier_rate, sat_lon, pol_mode, lock_th)
+        frame = build_frame_bytes("cmd", "sat", name, center_freq, carrier_freq, carrier_rate, sat_lon, pol_mode, lock_th)
         resp = self._safe_send_and_read(frame, retries=retries, timeout=timeout)
         return parse_sat(resp)
 
@@ -131,6 +147,6 @@ class ACUClient:
         retries: int = 2,
         timeout: float = 2.0,
     ) -> Dict[str, Any]:
-        frame = build_frame("cmd", "place", lon, lat, heading)
+        frame = build_frame_bytes("cmd", "place", lon, lat, heading)
         resp = self._safe_send_and_read(frame, retries=retries, timeout=timeout)
         return parse_place(resp)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 import serial
 import serial.tools.list_ports
 import threading
@@ -5,28 +6,54 @@ import time
 
 CRLF = b"\r\n"
 
-def xor_checksum(payload: str) -> str:
+def _xor_reduce(b) -> int:
+    """XOR of all bytes in a bytes-like object, as an int."""
+    n = len(b)
+    if not n:
+        return 0
+
+    # SWAR: read the whole payload as one big int and fold it in halves
+    # (log2(n) big-int ops instead of one Python loop iteration per byte)
+    x = int.from_bytes(b, "little")
+    while n > 1:
+        half = (n + 1) // 2
+        x = (x ^ (x >> (half * 8))) & ((1 << (half * 8)) - 1)
+        n = half
+    return x
+
+def xor_checksum(payload) -> str:
     """
     XOR of all ASCII chars between $ and * (excluding both)
     Return 2-hex UPPERCASE string (matching working code).
+    Accepts str or already-encoded bytes.
     """
-    csum = 0
-    for b in payload.encode("ascii"):
-        csum ^= b
-    return f"{csum:02X}"  # Uppercase to match working terminal code
+    b = payload.encode("ascii") if isinstance(payload, str) else payload
+    return f"{_xor_reduce(b):02X}"  # Uppercase to match working terminal code
 
-def build_frame(frame_type: str, frame_code: str, *data_fields: str) -> str:
+@lru_cache(maxsize=64)  # frames repeat a lot (polls, same sat/place/dir values); bytes are immutable
+def build_frame_bytes(frame_type: str, frame_code: str, *data_fields) -> bytes:
     """
-    Build protocol frame:
+    Build protocol frame straight into bytes (ready for sendall/write):
       $cmd,xxx,ddd,...*HH\r\n
     ✅ FIXED: NO trailing comma before * (was causing ACU to reject commands)
     """
-    parts = [f"${frame_type}", frame_code]
-    parts.extend(data_fields)
-
-    payload = ",".join(parts)  # NO trailing comma!
-    csum = xor_checksum(payload[1:])  # exclude $
-    return f"{payload}*{csum}\r\n"
+    buf = bytearray(b"$")
+    buf += frame_type.encode("ascii")
+    buf += b","
+    buf += frame_code.encode("ascii")
+    for f in data_fields:
+        buf += b","
+        buf += str(f).encode("ascii")
+
+    with memoryview(buf) as mv, mv[1:] as body:  # exclude $
+        csum = _xor_reduce(body)
+    buf += b"*%02X\r\n" % csum
+    return bytes(buf)
+
+@lru_cache(maxsize=64)  # the text form repeats just as much (log previews, manual buttons)
+def build_frame(frame_type: str, frame_code: str, *data_fields: str) -> str:
+    """Same frame as build_frame_bytes, as str (for display/logging callers)."""
+    return build_frame_bytes(frame_type, frame_code, *data_fields).decode("ascii")
 
 class ACUSerial:
     mode = "serial"
@@ -34,6 +61,8 @@ class ACUSerial:
     def __init__(self):
         self.ser = None
         self.lock = threading.Lock()
+        # Set after a timed-out request: a late reply may still arrive and must be flushed
+        self._stale = True
 
     @staticmethod
     def list_ports():
@@ -50,6 +79,7 @@ class ACUSerial:
             parity=serial.PARITY_NONE,
             stopbits=serial.STOPBITS_ONE,
         )
+        self._stale = True
         time.sleep(0.1)
 
     def disconnect(self):
@@ -64,19 +94,24 @@ class ACUSerial:
         if not self.is_connected():
             raise RuntimeError("Serial not connected")
 
-        raw = frame.encode("ascii")
+        raw = frame if isinstance(frame, (bytes, bytearray)) else frame.encode("ascii")
 
         for _ in range(retries):
             with self.lock:
-                self.ser.reset_input_buffer()
+                # Only flush when a previous request may have left a late reply behind
+                if self._stale:
+                    self.ser.reset_input_buffer()
+                    self._stale = False
+                if self.ser.timeout != timeout:
+                    self.ser.timeout = timeout
                 self.ser.write(raw)
                 self.ser.flush()
 
-                start = time.time()
-                while time.time() - start < timeout:
-                    line = self.ser.readline()
-                    if line:
-                        return line.decode("ascii", errors="replace").strip()
+                # Driver-side wait for the terminator (returns what it has on timeout)
+                line = self.ser.read_until(b"\n")  # same terminator readline() used
+                if line:
+                    return line.decode("ascii", errors="replace").strip()
+                self._stale = True
 
             time.sleep(0.02)
 
@@ -85,51 +120,52 @@ class ACUSerial:
 
 # ---------------- PARSERS ----------------
 
+# Field names by position (after the frame code), matched with dict(zip(...))
+_SHOW_KEYS = (
+    "preset_azimuth", "preset_pitch", "preset_polarization",
+    "current_azimuth", "current_pitch", "current_polarization",
+    "antenna_status",
+    "carrier_heading", "carrier_pitch", "carrier_roll",
+    "longitude", "latitude", "gps_status",
+    "limit_info", "alert_info", "agc_level",
+    "az_pot", "pitch_pot",
+)
+_SAT_KEYS = ("sat_name", "center_freq", "carrier_freq", "carrier_rate", "sat_longitude", "pol_mode", "lock_threshold")
+_PLACE_KEYS = ("longitude", "latitude", "heading")
+
+
+def _split_frame(s: str):
+    """'$x,a,b*hh' -> (['$x', 'a', 'b'], 'hh'); checksum is None when there is no '*'."""
+    body, sep, checksum = s.partition("*")
+    return [p.strip() for p in body.split(",")], (checksum.strip() if sep else None)
+
+
+def _fields(frame_code: str, keys: tuple, data: list) -> dict:
+    d = {"frame_code": frame_code}
+    d.update(zip(keys, data))
+    if len(data) < len(keys):
+        d.update(dict.fromkeys(keys[len(data):]))  # missing trailing fields -> None
+    return d
+
+
 def parse_show(line: str) -> dict:
     """
     Parse $show response.
     """
     try:
         s = line.strip()
-        if not s.lower().startswith("$show"):
+        sl = s.lower()
+        if not sl.startswith("$show"):
             return {"raw": line}
 
-        if "*" in s:
-            s, checksum = s.split("*", 1)
-            checksum = checksum.strip()
-        else:
-            checksum = None
-
-        parts = [p.strip() for p in s.split(",")]
+        parts, checksum = _split_frame(s)
         data = parts[1:]
 
-        def get(i, default=None):
-            return data[i] if i < len(data) else default
-
-        return {
-           "frame_code": "show",
-            "preset_azimuth": get(0),
-            "preset_pitch": get(1),
-            "preset_polarization": get(2),
-            "current_azimuth": get(3),
-            "current_pitch": get(4),
-            "current_polarization": get(5),
-            "antenna_status": get(6),
-            "carrier_heading": get(7),
-            "carrier_pitch": get(8),
-            "carrier_roll": get(9),
-            "longitude": get(10),
-            "latitude": get(11),
-            "gps_status": get(12),
-            "limit_info": get(13),
-            "alert_info": get(14),
-            "agc_level": get(15),
-            "az_pot": get(16),
-            "pitch_pot": get(17),
-            "time": ",".join(data[18:]).strip() if len(data) > 18 else get(18),
-            "checksum": checksum,
-            "raw": line,
-        }
+        d = _fields("show", _SHOW_KEYS, data)
+        d["time"] = ",".join(data[18:]).strip() if len(data) > 18 else None
+        d["checksum"] = checksum
+        d["raw"] = line
+        return d
     except Exception:
         return {"raw": line}
 
@@ -141,33 +177,16 @@ def parse_sat(line: str) -> dict:
     """
     try:
         s = line.strip()
-        if not s.lower().startswith("$cmd") or ",sat" not in s.lower():
+        sl = s.lower()  # lowercase once, not per check
+        if not sl.startswith("$cmd") or ",sat" not in sl:
             return {"raw": line}
 
-        if "*" in s:
-            s, checksum = s.split("*", 1)
-            checksum = checksum.strip()
-        else:
-            checksum = None
-
-        parts = [p.strip() for p in s.split(",")]
-        data = parts[2:]  # after $cmd,sat
-
-        def get(i, default=None):
-            return data[i] if i < len(data) else default
-
-        return {
-            "frame_code": "sat",
-            "sat_name": get(0),
-            "center_freq": get(1),
-            "carrier_freq": get(2),
-            "carrier_rate": get(3),
-            "sat_longitude": get(4),
-            "pol_mode": get(5),
-            "lock_threshold": get(6),
-            "checksum": checksum,
-            "raw": line
-        }
+        parts, checksum = _split_frame(s)
+
+        d = _fields("sat", _SAT_KEYS, parts[2:])  # after $cmd,sat
+        d["checksum"] = checksum
+        d["raw"] = line
+        return d
     except Exception:
         return {"raw": line}
 
@@ -179,29 +198,16 @@ def parse_place(line: str) -> dict:
     """
     try:
         s = line.strip()
-        if not s.lower().startswith("$cmd") or ",place" not in s.lower():
+        sl = s.lower()  # lowercase once, not per check
+        if not sl.startswith("$cmd") or ",place" not in sl:
             return {"raw": line}
 
-        if "*" in s:
-            s, checksum = s.split("*", 1)
-            checksum = checksum.strip()
-        else:
-            checksum = None
-
-        parts = [p.strip() for p in s.split(",")]
-        data = parts[2:]  # after $cmd,place
-
-        def get(i, default=None):
-            return data[i] if i < len(data) else default
-
-        return {
-            "frame_code": "place",
-            "longitude": get(0),
-            "latitude": get(1),
-            "heading": get(2),
-            "checksum": checksum,
-            "raw": line
-        }
+        parts, checksum = _split_frame(s)
+
+        d = _fields("place", _PLACE_KEYS, parts[2:])  # after $cmd,place
+        d["checksum"] = checksum
+        d["raw"] = line
+        return d
     except Exception:
         return {"raw": line}
 
@@ -1,5 +1,7 @@
 # services/acu_scraper.py
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import re
 import os
@@ -9,6 +11,13 @@ from pprint import pprint
 from dotenv import load_dotenv
 from typing import Dict, Any, Optional
 
+# Optional RE2 (google-re2): linear-time DFA matching in native code, same pattern syntax
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
 load_dotenv()
 
 # NOTE: keeping your env key names as-is
@@ -17,6 +26,13 @@ ACU_USER = os.getenv("ACU_USERNAME")
 ACU_PASS = os.getenv("ACU_PASSWORD")
 APP_MODE = os.getenv("APP_MODE")
 
+# home.js JSONP: compiled once, matched on the raw body bytes (no text decode)
+_JSONP_CALLBACK = b"settingsCallback("
+_TRAILING_COMMA_PATTERN = rb",\s*\]"
+_TRAILING_COMMA_RE = (
+    re2.compile(_TRAILING_COMMA_PATTERN) if HAS_RE2 else re.compile(_TRAILING_COMMA_PATTERN, re.ASCII)
+)
+
 LOGIN_ROUTE = "/login.cgi"
 LOGIN_PAYLOAD = {
     "user": ACU_USER,
@@ -54,10 +70,30 @@ class ACUClient:
                 "AppleWebKit/537.36 (KHTML, like Gecko) "
                 "Chrome/91.0.4472.124 Safari/537.36"
             ),
-            "Origin": self.base_url
+            "Origin": self.base_url,
+            "Connection": "keep-alive",
         })
+        # One pooled keep-alive socket to the ACU web UI; transient resets retried in urllib3
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=1,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self._login()
 
+    def close(self):
+        try:
+            self.session.close()
+        except Exception:
+            pass
+
+    def __del__(self):
+        # don't leak the pooled socket if the client is dropped (e.g. DataWorker reset)
+        if hasattr(self, "session"):
+            self.close()
+
     def _login(self):
         try:
             login_url = f"{self.base_url}/login.cgi"
@@ -82,20 +118,22 @@ class ACUClient:
             }
             data_response = self.session.post(data_url, headers=headers, timeout=5)
             data_response.raise_for_status()
-            return self._parse_jsonp(data_response.text)
+            return self._parse_jsonp(data_response.content)
         except requests.exceptions.RequestException as e:
             logging.error(f"Network error while fetching ACU data: {e}")
             return None
 
     @staticmethod
-    def _parse_jsonp(jsonp_string):
-        callback = "settingsCallback("
-        if jsonp_string.startswith(callback):
+    def _parse_jsonp(jsonp_bytes):
+        if isinstance(jsonp_bytes, str):
+            jsonp_bytes = jsonp_bytes.encode("utf-8")
+        if jsonp_bytes.startswith(_JSONP_CALLBACK):
             try:
-                json_string = jsonp_string[len(callback):-2]
-                json_string_cleaned = re.sub(r",\s*\]", "]", json_string)
-                return json.loads(json_string_cleaned)
-            except json.JSONDecodeError as e:
+                json_bytes = jsonp_bytes[len(_JSONP_CALLBACK):-2]
+                json_bytes_cleaned = _TRAILING_COMMA_RE.sub(b"]", json_bytes)
+                return json.loads(json_bytes_cleaned)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                # json.loads decodes the raw bytes itself: a non-UTF-8 body fails here, not in .text
                 logging.error(f"Error decoding JSONP content: {e}")
                 return None
 
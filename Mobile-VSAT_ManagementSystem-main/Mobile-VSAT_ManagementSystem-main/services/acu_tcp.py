@@ -1,3 +1,4 @@
+import select
 import socket
 import threading
 import time
@@ -7,9 +8,16 @@ class ACUTcp:
 
     def __init__(self):
         self.sock = None
-        self.lock = threading.Lock()
+        # Request/response window (drain + send + read). The ACU protocol has no request ids,
+        # so a reply can only be matched to its request by keeping one exchange on the wire.
+        self.lock = threading.RLock()
+        # Reconnects are serialized on their own lock, outside the request window
+        self._reconnect_lock = threading.Lock()
+        self._gen = 0  # bumped on every connect: tells a failed request whether the socket was replaced
+        self._closed = False  # set by disconnect(): no automatic reconnects until connect()
         self.host = None
         self.port = None
+        self._rbuf = bytearray()  # received but not yet consumed
 
     def connect(self, host: str, port: int, timeout=5.0):
         self.host = host
@@ -18,92 +26,184 @@ class ACUTcp:
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Short request/response frames: don't let Nagle hold them back waiting for an ACK
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         s.settimeout(timeout)
         s.connect((host, port))
 
-        self.sock = s
+        # Only the swap happens inside the request window, never the connect itself
+        with self.lock:
+            self.sock = s
+            self._rbuf.clear()
+            self._gen += 1
+            self._closed = False
+
+    @property
+    def generation(self) -> int:
+        return self._gen
+
+    @property
+    def closed(self) -> bool:
+        """True after an explicit disconnect() (as opposed to a dropped connection)."""
+        return self._closed
 
     def reconnect(self, timeout=5.0):
-        if self.host and self.port:
-            self.disconnect()
+        self.reconnect_if_stale(None, timeout=timeout)
+
+    def reconnect_if_stale(self, gen, timeout=5.0):
+        """
+        Reconnect unless another thread already did since `gen` was read (checked before and
+        after taking the reconnect lock): requests failing on the same dead socket cause one
+        reconnect, not one each. gen=None always reconnects.
+        """
+        if not (self.host and self.port):
+            return
+        if gen is not None and (self._closed or (gen != self._gen and self.sock is not None)):
+            return
+        with self._reconnect_lock:
+            if gen is not None and (self._closed or (gen != self._gen and self.sock is not None)):
+                return
+            self._close_socket()
             time.sleep(0.5)
             self.connect(self.host, self.port, timeout=timeout)
 
     def disconnect(self):
-        if self.sock:
+        self._closed = True
+        self._close_socket()
+
+    def _close_socket(self):
+        # Swap first: a reader still holding the old socket fails with EBADF/ValueError and retries.
+        # shutdown() before close(): a thread blocked in select()/recv() on it returns at once
+        # (close() alone doesn't wake it on Linux)
+        sock, self.sock = self.sock, None
+        if sock:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             try:
-                self.sock.close()
+                sock.close()
             except Exception:
                 pass
-        self.sock = None
 
     def is_connected(self):
         return self.sock is not None
 
-    def send_and_read(self, frame, retries=3, timeout=5.0):
-        if not self.is_connected():
+    def _drain(self, sock):
+        """Throw away anything unread (stale streaming data) without waiting for it."""
+        self._rbuf.clear()
+        # Zero-timeout readiness check instead of toggling the socket timeout: a recv
+        # after select() says readable returns at once, and an empty buffer costs one call.
+        # (MSG_DONTWAIT doesn't help here: with a timeout set, Python's recv waits out
+        # EAGAIN itself.)
+        while select.select([sock], [], [], 0)[0]:
+            if not sock.recv(4096):
+                break
+
+    def _readline(self, sock, deadline: float) -> bytes:
+        """
+        One line from the socket, buffered. Waits in select() until data arrives or the
+        overall deadline passes: one kernel wait per chunk, no timeout polling.
+        """
+        while True:
+            i = self._rbuf.find(b"\n")
+            if i >= 0:
+                # copy the line out through a view (one copy, not slice + bytes()),
+                # release it, then drop the consumed bytes in place
+                with memoryview(self._rbuf) as mv, mv[:i + 1] as part:
+                    line = bytes(part)
+                del self._rbuf[:i + 1]
+                return line
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([sock], [], [], remaining)[0]:
+                raise socket.timeout("ACU reply timed out")
+            chunk = sock.recv(4096)
+            if not chunk:
+                raise ConnectionError("TCP Closed by peer")
+            self._rbuf += chunk
+
+    def _has_pending(self, sock) -> bool:
+        if b"\n" in self._rbuf:
+            return True
+        readable, _, _ = select.select([sock], [], [], 0)
+        return bool(readable)
+
+    @staticmethod
+    def _is_complete(lines: list, terminator) -> bool:
+        # bytes: marker on the last line received; callable: decides on the whole reply so far
+        if callable(terminator):
+            return terminator(b"".join(lines))
+        return terminator in lines[-1]
+
+    def send_and_read(self, frame, retries=3, timeout=5.0, terminator=None):
+        """Same as send_and_read_bytes, decoded to text for display/str parsers."""
+        data = self.send_and_read_bytes(frame, retries=retries, timeout=timeout, terminator=terminator)
+        return data.decode("ascii", errors="replace")
+
+    def send_and_read_bytes(self, frame, retries=3, timeout=5.0, terminator=None) -> bytes:
+        """
+        Send a frame and return the stripped raw reply (bytes parsers can skip the decode).
+        frame: pass pre-encoded bytes (build_frame_bytes) on hot paths; str is encoded per call.
+        terminator: bytes marker expected on the reply's last line, or callable(reply) -> bool.
+        Without one, a checksummed "$...*HH" line is a complete reply on its own; anything
+        else is read for as long as more lines are already waiting.
+        """
+        # mid-reconnect counts as connected: the attempt below waits for the new socket
+        if not self.is_connected() and not self._reconnect_lock.locked():
             raise RuntimeError("TCP not connected")
 
         raw = frame if isinstance(frame, (bytes, bytearray)) else frame.encode("ascii")
 
         for attempt in range(retries):
-            with self.lock:
-                try:
+            gen = self._gen
+            conn_down = False  # only a connection we couldn't restore is worth waiting on
+            try:
+                with self.lock:
+                    # One socket reference for the whole exchange (reconnect swaps self.sock)
+                    sock, gen = self.sock, self._gen
+                    if sock is None:
+                        raise ConnectionError("TCP socket closed")
+
                     # Drain input buffer to avoid reading stale streaming data
-                    self.sock.settimeout(0.01)
-                    try:
-                        while True:
-                            if not self.sock.recv(4096):
-                                break
-                    except socket.timeout:
-                        pass
-                    except Exception:
-                        pass
+                    self._drain(sock)
 
                     # Send
-                    self.sock.settimeout(timeout)
-                    self.sock.sendall(raw)
-
-                    # Read FULL response (multi-line), not just the first line
-                    buff = b""
-                    start = time.time()
-
-                    # We will keep reading until:
-                    # - overall timeout reached, OR
-                    # - we already got at least one newline AND the socket goes idle briefly
-                    idle_timeout = 0.5
-                    last_rx = None
-
-                    while time.time() - start < timeout:
-                        # use short recv timeout so we can detect "idle"
-                        self.sock.settimeout(idle_timeout)
-                        try:
-                            chunk = self.sock.recv(4096)
-                        except socket.timeout:
-                            # if we already received something and it includes a newline, treat idle as end of message
-                            if buff and (b"\n" in buff or b"\r\n" in buff):
+                    deadline = time.monotonic() + timeout
+                    sock.sendall(raw)
+
+                    # Read FULL response (multi-line), not just the first line:
+                    # first line blocks (up to timeout), then keep going while more is
+                    # already there, stopping at a blank line
+                    lines = [self._readline(sock, deadline)]
+                    if terminator is not None:
+                        # stop exactly at the protocol terminator
+                        while not self._is_complete(lines, terminator):
+                            lines.append(self._readline(sock, deadline))
+                    elif not (lines[0].startswith(b"$") and b"*" in lines[0]):
+                        while self._has_pending(sock):
+                            line = self._readline(sock, deadline)
+                            if not line.strip():
                                 break
-                            continue
-
-                        if not chunk:
-                            raise ConnectionError("TCP Closed by peer")
+                            lines.append(line)
 
-                        buff += chunk
-                        last_rx = time.time()
+                    data = b"".join(lines).strip()
+                    if data:
+                        return data
 
-                    text = buff.decode("ascii", errors="replace").strip()
-                    if text:
-                        return text
-
-                except socket.timeout:
-                    pass
+            except socket.timeout:
+                pass  # the read already waited out the deadline: retry straight away
+            except Exception:
+                if self._closed:
+                    raise ConnectionError("TCP disconnected")
+                # Reconnect outside the request lock, and only if nobody beat us to it
+                try:
+                    self.reconnect_if_stale(gen, timeout=timeout)
                 except Exception:
-                    # try reconnect once
-                    try:
-                        self.reconnect(timeout=timeout)
-                    except Exception:
-                        pass
+                    conn_down = True
 
-            time.sleep(0.2)
+            # Timeouts, empty replies and fresh sockets retry at once; a failed reconnect
+            # backs off 50, 100, 200, 300 ms ... (retries=1 callers do their own backoff)
+            if conn_down and attempt + 1 < retries:
+                time.sleep(min(0.05 * 2 ** attempt, 0.3))
 
         raise TimeoutError("No TCP response after retries")
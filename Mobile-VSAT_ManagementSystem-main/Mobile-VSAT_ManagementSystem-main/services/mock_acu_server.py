@@ -1,78 +1,240 @@
+import asyncio
+import logging
+import random
+import re
 import socket
-import threading
+import sys
 import time
 
+# Optional numpy for the axis simulation (plain lists otherwise)
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 HOST = "127.0.0.1"
 PORT = 2217
 
-# Simple fake state
+# RX/TX traffic is logged at DEBUG (run with --verbose); nothing is formatted otherwise
+log = logging.getLogger(__name__)
+
+# Axis state as arrays (az, el, pol) instead of per-axis dict entries
+AXES = ("azimuth", "elevation", "polarization")
+STEP_DEG = 0.1  # max movement per POLL_INTERVAL, per axis
+POLL_INTERVAL = 0.1  # seconds
+
+if HAS_NUMPY:
+    POS = np.array([123.45, 32.10, 10.00])
+    TGT = np.array([125.00, 33.00, 10.50])
+else:
+    POS = [123.45, 32.10, 10.00]
+    TGT = [125.00, 33.00, 10.50]
+
+# Antenna status code / AGC are derived per show reply (see build_show_parts)
+_STATUS_TRACK = b"2"   # tracking: azimuth within TRACK_WINDOW_DEG of target
+_STATUS_SEARCH = b"1"  # still slewing/searching
+TRACK_WINDOW_DEG = 1.0
+
+# Simple fake state (static fields)
 STATE = {
-    "current_azimuth": 123.45,
-    "current_elevation": 32.10,
-    "current_polarization": 10.00,
-    "target_azimuth": 125.00,
-    "target_elevation": 33.00,
-    "target_polarization": 10.50,
-    "antenna_status": "2",  # tracking
-    "agc": "78",
     "gps_status": "OK",
     "latitude": "-6.250000",
     "longitude": "107.150000",
 }
 
+# Simulation is advanced lazily from wall time, not once per received command
+LAST_TS = time.monotonic()
+
+# Bumped whenever POS/TGT change; the formatted axis lines are cached per version
+_STATE_VER = 0
+
+
+def _bump_state():
+    global _STATE_VER
+    _STATE_VER += 1
+
+
+def _advance(now: float):
+    """Move every axis towards its target by STEP_DEG per elapsed POLL_INTERVAL (one clip)."""
+    global LAST_TS
+    max_step = STEP_DEG * (now - LAST_TS) / POLL_INTERVAL
+    LAST_TS = now
+    if max_step <= 0:
+        return
+    if HAS_NUMPY:
+        if not (POS != TGT).any():
+            return  # parked on target: nothing moves, cached lines stay valid
+        np.copyto(POS, POS + np.clip(TGT - POS, -max_step, max_step))
+    else:
+        if POS == TGT:
+            return
+        for i in range(3):
+            POS[i] += max(-max_step, min(max_step, TGT[i] - POS[i]))
+    _bump_state()
+
+
+def build_response_bytes(items) -> bytes:
+    """key=value lines assembled directly as bytes (no str join + encode)."""
+    buf = bytearray()
+    for k, v in items:
+        buf += b"%s=%s\n" % (k.encode(), str(v).encode())
+    return bytes(buf)
+
+
+# Show reply skeleton: axis/target/status lines are formatted once per state version
+# (one bytes %-format), AGC per reply, and STATE never changes so it stays pre-encoded
+# (call _rebuild_show_tail() if it does).
+_AXES_FMT = (
+    b"".join(f"current_{a}=%.2f\n".encode() for a in AXES)
+    + b"".join(f"target_{a}=%.2f\n".encode() for a in AXES)
+    + b"antenna_status=%b\n"
+)
+_AXES_CACHE = (-1, b"")  # (state version, formatted lines)
+_SHOW_TAIL = memoryview(b"")  # sent as its own buffer, never copied into the reply
+
+
+def _rebuild_show_tail():
+    global _SHOW_TAIL
+    _SHOW_TAIL = memoryview(build_response_bytes(STATE.items()))
+
+
+_rebuild_show_tail()
+
+
+def build_show_parts() -> tuple:
+    """
+    (axes, agc, tail): cached axis/status lines, a fresh AGC line and the cached STATE tail
+    (memoryview). They go out as separate buffers of one vectored write.
+    """
+    global _AXES_CACHE
+    if _AXES_CACHE[0] != _STATE_VER:
+        status = _STATUS_TRACK if abs(POS[0] - TGT[0]) < TRACK_WINDOW_DEG else _STATUS_SEARCH
+        # plain floats format faster than numpy scalars
+        cur, tgt = (POS.tolist(), TGT.tolist()) if HAS_NUMPY else (POS, TGT)
+        _AXES_CACHE = (_STATE_VER, _AXES_FMT % (*cur, *tgt, status))
+    agc = 2.0 + 2.5 * random.random()  # 2.0 .. 4.5 V, same as uniform() without the call overhead
+    return _AXES_CACHE[1], b"agc=%.2f\n" % agc, _SHOW_TAIL
+
 
-def handle_client(conn: socket.socket, addr):
-    print("Client connected:", addr)
-    conn.settimeout(1.0)
-    buf = b""
+# ---------------- COMMAND DISPATCH ----------------
+
+# Handlers return a tuple of buffers; all of a burst's buffers go to one writelines()
+_OK_PARTS = (b"OK\n",)
+
+
+def _reply_show(line: bytes, head: list) -> tuple:
+    # Catch the fake state up to now, only when someone reads it
+    _advance(time.monotonic())
+    return build_show_parts()
+
+
+def _reply_ok(line: bytes, head: list) -> tuple:
+    return _OK_PARTS
+
+
+# "$cmd,dir,az,el,pol*hh" -> new targets; one match instead of split + 3 index lookups
+_DIR_RE = re.compile(rb"^\$cmd,dir,(-?\d+\.?\d*),(-?\d+\.?\d*),(-?\d+\.?\d*)", re.I)
+
+
+def _reply_dir(line: bytes, head: list) -> tuple:
+    m = _DIR_RE.match(line)
+    if m:
+        _advance(time.monotonic())  # settle motion towards the old target first
+        TGT[0], TGT[1], TGT[2] = map(float, m.groups())
+        _bump_state()
+    return _OK_PARTS
+
+
+# Very simple protocol:
+# "$cmd,get show*.." / "$show,1,*.." / "show" -> key=value lines, anything else -> OK
+HANDLERS = {
+    b"show": _reply_show,
+    b"get show": _reply_show,
+    b"dir": _reply_dir,
+}
+
+
+def _split_command(line: bytes):
+    """
+    One partition + one split per line: returns (key, head) where key is the lowercased
+    command token ("show", "get show", "sat", "dir", ...) and head the comma fields.
+    """
+    head = line.partition(b"*")[0].split(b",", 3)
+    key = head[0].lstrip(b"$").strip().lower()
+    if key == b"cmd":
+        key = head[1].strip().lower() if len(head) > 1 else b""
+    return key, head
+
+
+async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    addr = writer.get_extra_info("peername")
+    log.info("Client connected: %s", addr)
+    # asyncio already sets TCP_NODELAY; make it explicit
+    sock = writer.get_extra_info("socket")
+    if sock is not None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    buf = bytearray()  # grows in place; consumed lines are deleted from the front
     try:
         while True:
-            try:
-                data = conn.recv(4096)
-                if not data:
-                    break
-                buf += data
-            except socket.timeout:
-                continue
+            data = await reader.read(4096)
+            if not data:
+                break
+            buf += data
 
-            # process lines
-            while b"\n" in buf:
-                line, buf = buf.split(b"\n", 1)
-                cmd = line.decode(errors="ignore").strip()
-                print("RX:", cmd)
+            # Take every complete line at once: one copy (through a view) + one in-place del
+            # per burst, split in C
+            end = buf.rfind(b"\n")
+            if end < 0:
+                continue
+            with memoryview(buf) as mv, mv[:end] as burst:
+                lines = bytes(burst).split(b"\n")
+            del buf[:end + 1]
 
-                # Update fake state a bit to look alive
-                STATE["current_azimuth"] = round(STATE["current_azimuth"] + 0.1, 2)
-                STATE["agc"] = str(int(STATE["agc"]) % 100)
+            # replies for the whole burst go out together
+            pending = []
+            debug = log.isEnabledFor(logging.DEBUG)  # once per burst, not per line
+            for line in lines:
+                line = line.strip()
+                if debug:
+                    log.debug("RX: %s", line.decode(errors="ignore"))
 
-                # Very simple protocol:
-                # if "get show" -> return key=value lines
-                # MVMS sends "$show,1,*.." so treat "$show" as "get show"
-                if cmd.startswith("$show") or "get show" in cmd or cmd.startswith("show"):
-                    resp = "\n".join([f"{k}={v}" for k, v in STATE.items()]) + "\n"
-                else:
-                 resp = "OK\n"
+                key, head = _split_command(line)
+                resp = HANDLERS.get(key, _reply_ok)(line, head)
 
+                pending.extend(resp)
+                if debug:
+                    log.debug("TX: %s", bytes(resp[0][:120]).decode(errors="ignore").replace("\n", "\\n"))
 
-                conn.sendall(resp.encode())
-                print("TX:", resp[:120].replace("\n", "\\n"))
+            if pending:
+                writer.writelines(pending)  # one write per burst (sendmsg, no join, on Python 3.12+)
+                await writer.drain()
     except Exception as e:
-        print("Client error:", e)
+        log.warning("Client error: %s", e)
     finally:
-        conn.close()
-        print("Client disconnected:", addr)
+        writer.close()
+        try:
+            await writer.wait_closed()  # release the socket now, not at GC time
+        except Exception:
+            pass
+        log.info("Client disconnected: %s", addr)
 
 
-def main():
-    print(f"Mock ACU listening on {HOST}:{PORT}")
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        s.bind((HOST, PORT))
-        s.listen(5)
-        while True:
-            conn, addr = s.accept()
-            threading.Thread(target=handle_client, args=(conn, addr), daemon=True).start()
+async def main():
+    # One event loop for every client: no thread per connection, no locking on the state
+    server = await asyncio.start_server(handle_client, HOST, PORT, reuse_address=True)
+    for sock in server.sockets:
+        log.info("Mock ACU listening on %s:%s", *sock.getsockname()[:2])
+    async with server:
+        await server.serve_forever()
 
 
 if __name__ == "__main__":
-    main()
+    logging.basicConfig(
+        level=logging.DEBUG if "--verbose" in sys.argv[1:] else logging.INFO,
+        format="%(asctime)s %(message)s",
+    )
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        log.info("Mock ACU stopped")
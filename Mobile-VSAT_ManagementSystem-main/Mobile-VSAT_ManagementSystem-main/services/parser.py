@@ -1,44 +1,71 @@
-def parse_show(line: str) -> dict:
+import re
+
+# Field names by position after "$show"; the 19th field (time) may itself contain commas
+_SHOW_KEYS = (
+    "preset_azimuth", "preset_pitch", "preset_polarization",
+    "current_azimuth", "current_pitch", "current_polarization",
+    "antenna_status",
+    "carrier_heading", "carrier_pitch", "carrier_roll",
+    "longitude", "latitude", "gps_status",
+    "limit_info", "alert_info", "agc_level",
+    "az_pot", "pitch_pot",
+)
+
+# Full frame in one match: 18 plain fields, then time up to '*', then optional checksum
+_SHOW_PATTERN = r"^(\$show)" + r",([^,*]*)" * len(_SHOW_KEYS) + r",([^*]*)(?:\*(.*))?$"
+_SHOW_RE = re.compile(_SHOW_PATTERN, re.IGNORECASE | re.DOTALL)
+
+
+def parse_show(line) -> dict:
+    """Parse a $show frame given as str or as the raw bytes read from the ACU ("raw" is always str)."""
+    if isinstance(line, (bytes, bytearray)):
+        # decode once up front so both the regex and the fallback path see the same str
+        line = bytes(line).decode("ascii", errors="replace")
+    return parse_show_str(line)
+
+
+def parse_show_str(line: str) -> dict:
     try:
         s = line.strip()
-        if not s.lower().startswith("$show"):
-            return {"raw": line}
-
-        if "*" in s:
-            s, checksum = s.split("*", 1)
-            checksum = checksum.strip()
-        else:
-            checksum = None
-
-        parts = [p.strip() for p in s.split(",")]
-        data = parts[1:]
-
-        def get(i, default=None):
-            return data[i] if i < len(data) else default
-
-        return {
-            "frame_code": parts[0],
-            "preset_azimuth": get(0),
-            "preset_pitch": get(1),
-            "preset_polarization": get(2),
-            "current_azimuth": get(3),
-            "current_pitch": get(4),
-            "current_polarization": get(5),
-            "antenna_status": get(6),
-            "carrier_heading": get(7),
-            "carrier_pitch": get(8),
-            "carrier_roll": get(9),
-            "longitude": get(10),
-            "latitude": get(11),
-            "gps_status": get(12),
-            "limit_info": get(13),
-            "alert_info": get(14),
-            "agc_level": get(15),
-            "az_pot": get(16),
-            "pitch_pot": get(17),
-            "time": ",".join(data[18:]).strip() if len(data) > 18 else get(18),
-            "checksum": checksum,
-            "raw": line,
-        }
-    except:
+        m = _SHOW_RE.match(s)
+        if m:
+            return _show_dict(m.groups(), line)
+        return _parse_show_slow(line)
+    except Exception:
         return {"raw": line}
+
+
+def _show_dict(g, line) -> dict:
+    d = {"frame_code": g[0]}
+    d.update(zip(_SHOW_KEYS, (x.strip() for x in g[1:19])))
+    t = g[19]
+    d["time"] = ",".join(p.strip() for p in t.split(",")).strip() if "," in t else t.strip()
+    d["checksum"] = g[20].strip() if g[20] is not None else None
+    d["raw"] = line
+    return d
+
+
+def _parse_show_slow(line: str) -> dict:
+    """Short/odd frames the regex doesn't cover (missing fields come back as None)."""
+    s = line.strip()
+    if not s.lower().startswith("$show"):
+        return {"raw": line}
+
+    if "*" in s:
+        s, checksum = s.split("*", 1)
+        checksum = checksum.strip()
+    else:
+        checksum = None
+
+    parts = [p.strip() for p in s.split(",")]
+    data = parts[1:]
+
+    def get(i, default=None):
+        return data[i] if i < len(data) else default
+
+    d = {"frame_code": parts[0]}
+    d.update((k, get(i)) for i, k in enumerate(_SHOW_KEYS))
+    d["time"] = ",".join(data[18:]).strip() if len(data) > 18 else get(18)
+    d["checksum"] = checksum
+    d["raw"] = line
+    return d
@@ -1,21 +1,23 @@
 # services/test_acu_tcp.py
 from services.acu_tcp import ACUTcp
-from services.acu_driver import build_frame, parse_show
+from services.acu_driver import build_frame_bytes, parse_show
 
 HOST = "192.168.0.1"
 PORT = 2217
 
+# Change this if your ACU expects a different $show format (encoded once, sent as-is)
+SHOW_FRAME = build_frame_bytes("show", "1")
+
 def main():
     tcp = ACUTcp()
     print(f"Connecting to {HOST}:{PORT} ...")
     tcp.connect(HOST, PORT, timeout=5.0)
     print("Connected:", tcp.is_connected())
 
-    # Change this if your ACU expects a different $show format
-    frame = build_frame("show", "1")
-    print("Sending:", repr(frame))
+    print("Sending:", repr(SHOW_FRAME))
 
-    resp = tcp.send_and_read(frame, retries=2, timeout=2.0)
+    # $show reply is one "$show,...*HH" line: done as soon as the checksum marker arrives
+    resp = tcp.send_and_read(SHOW_FRAME, retries=2, timeout=2.0, terminator=b"*")
     print("Raw response:", resp)
 
     parsed = parse_show(resp)
@@ -1,5 +1,7 @@
 # services/uhp_scraper.py
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import time
 import logging
@@ -18,6 +20,29 @@ if not SCRAPER_ENABLED:
     UHP_URL = UHP_URL or ""
     print("[WARN] UHP scraper env var missing (UHP_IP). Modem scraper disabled.")
 
+# Labelled form of the value ("... SCPC C/N 12.3 dB ..."), found with a literal scan
+_CN_ANCHOR = b"SCPC C/N "
+_CN_UNIT = b" dB"
+
+
+def _parse_cn(body: bytes) -> float:
+    """
+    C/N from the raw response body. Normally the body is just the number; if the modem
+    answers with the labelled status text instead, locate the value with bytes.find
+    (memchr/memmem in C) rather than a regex pass over the whole page.
+    """
+    try:
+        return float(body.strip())
+    except ValueError:
+        i = body.find(_CN_ANCHOR)
+        if i < 0:
+            raise
+        i += len(_CN_ANCHOR)
+        j = body.find(_CN_UNIT, i)
+        if j < 0:
+            raise
+        return float(body[i:j])
+
 
 class UHPClient:
     def __init__(self, base_url: str, max_retries: int = 3):
@@ -29,7 +54,26 @@ class UHPClient:
         self.data_url = f"http://{self.base_url}/ss54?dJ=1"
         self.max_retries = max_retries
         self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "ACU_Dashboard_Client/1.0"})
+        self.session.headers.update({"User-Agent": "ACU_Dashboard_Client/1.0", "Connection": "keep-alive"})
+        # One pooled keep-alive socket to the modem; transient resets retried without a new session
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=1,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        try:
+            self.session.close()
+        except Exception:
+            pass
+
+    def __del__(self):
+        # don't leak the pooled socket if the client is dropped (e.g. DataWorker reset)
+        if hasattr(self, "session"):
+            self.close()
 
     def get_cn_ratio(self) -> Optional[float]:
         """
@@ -44,7 +88,9 @@ class UHPClient:
             try:
                 response = self.session.get(self.data_url, timeout=5)
                 response.raise_for_status()
-                return float(response.text.strip())
+                # Body is just the number: parse the raw bytes, skipping .text's
+                # charset detection + decode of the whole body
+                return _parse_cn(response.content)
 
             except requests.exceptions.RequestException as e:
                 logging.error(f"UHP fetch attempt {attempt + 1}/{self.max_retries} failed: {e}")
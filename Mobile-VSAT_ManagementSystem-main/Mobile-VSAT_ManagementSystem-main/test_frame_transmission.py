@@ -1,16 +1,18 @@
 """
 ACU Frame Tester - Test exact frames being sent
 """
-import socket
-import time
 import sys
 sys.path.insert(0, '.')
 
-from services.acu_driver import build_frame
+from services.acu_driver import build_frame_bytes
+from services.acu_tcp import ACUTcp
 
 HOST = "192.168.0.1"
 PORT = 2217
 
+# Per-frame build details and HEX dumps only with --verbose
+VERBOSE = "--verbose" in sys.argv[1:]
+
 def test_frame_sending():
     """
     Test sending exact frames and show HEX dump
@@ -27,6 +29,18 @@ def test_frame_sending():
     print("="*70)
     print(f"\nTarget: {HOST}:{PORT}\n")
     
+    # One connection for the whole run; each frame is sent on its own and its reply
+    # awaited before the next, so a missing reply is pinned to the right frame
+    print("-"*70)
+    tcp = ACUTcp()
+    try:
+        print(f"\n   Connecting...")
+        tcp.connect(HOST, PORT, timeout=2.0)
+        print(f"   ✅ Connected")
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
+        tcp = None
+    
     for frame_code, desc in commands:
         print("-"*70)
         print(f"\n📋 Testing: {desc}")
@@ -35,61 +49,40 @@ def test_frame_sending():
         # Build frame
         parts = frame_code.split(',')
         if len(parts) >= 2:
-            frame = build_frame(parts[0], parts[1], *parts[2:])
+            frame = build_frame_bytes(parts[0], parts[1], *parts[2:])
         else:
-            frame = build_frame('cmd', frame_code)
+            frame = build_frame_bytes('cmd', frame_code)
         
-        print(f"\n   Built Frame (ASCII): {repr(frame)}")
-        print(f"   Built Frame (HEX):   {frame.encode('ascii').hex()}")
-        print(f"   Length: {len(frame)} bytes")
+        if VERBOSE:
+            print(f"\n   Built Frame (ASCII): {repr(frame.decode('ascii'))}")
+            print(f"   Built Frame (HEX):   {frame.hex()}")
+            print(f"   Length: {len(frame)} bytes")
         
-        # Try to send
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2.0)
-            
-            print(f"\n   Connecting...")
-            sock.connect((HOST, PORT))
-            print(f"   ✅ Connected")
-            
-            print(f"\n   Sending frame...")
-            sock.sendall(frame.encode('ascii'))
-            print(f"   ✅ Sent {len(frame)} bytes")
-            
-            print(f"\n   Waiting for response...")
-            sock.settimeout(3.0)
-            
-            response = b''
-            start = time.time()
+        response = None
+        if tcp is not None:
             try:
-                while time.time() - start < 3.0:
-                    chunk = sock.recv(4096)
-                    if not chunk:
-                        break
-                    response += chunk
-                    if b'\n' in response:
-                        break
-            except socket.timeout:
+                print(f"\n   Sending frame...")
+                response = tcp.send_and_read(frame, retries=1, timeout=3.0)
+            except TimeoutError:
                 pass
-            
-            sock.close()
-            
-            if response:
-                print(f"   ✅ Got response:")
-                print(f"      ASCII: {response.decode('ascii', errors='replace').strip()}")
-                print(f"      HEX:   {response.hex()}")
-            else:
-                print(f"   ❌ NO RESPONSE from ACU")
-                print(f"      This means ACU is NOT processing commands")
-                print(f"      Possible reasons:")
-                print(f"         - Remote control is disabled")
-                print(f"         - ACU doesn't recognize command format")
-                print(f"         - ACU is in local-only mode")
-            
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
+            except Exception as e:
+                print(f"   ❌ Error: {e}")
         
-        time.sleep(0.5)
+        if response:
+            print(f"   ✅ Got response:")
+            print(f"      ASCII: {response}")
+            if VERBOSE:
+                print(f"      HEX:   {response.encode('ascii', errors='replace').hex()}")
+        else:
+            print(f"   ❌ NO RESPONSE from ACU")
+            print(f"      This means ACU is NOT processing commands")
+            print(f"      Possible reasons:")
+            print(f"         - Remote control is disabled")
+            print(f"         - ACU doesn't recognize command format")
+            print(f"         - ACU is in local-only mode")
+    
+    if tcp is not None:
+        tcp.disconnect()
     
     print("\n" + "="*70)
     print("\n💡 CONCLUSIONS:")
@@ -118,7 +111,7 @@ if __name__ == "__main__":
 ╚══════════════════════════════════════════════════════════════════╝
 
 This will test EXACT frames being sent to ACU.
-Shows ASCII, HEX, and checks if ACU responds.
+Shows ASCII (HEX with --verbose) and checks if ACU responds.
 """)
     
     input("Press Enter to start test...")
@@ -2,29 +2,41 @@
 from __future__ import annotations
 
 import os
+import threading
+from collections import deque
 
 from PySide6.QtGui import QTextCursor, QDesktopServices, QPixmap
-from PySide6.QtCore import QObject, QThread, Signal, Slot, Qt, QSettings, QUrl, QTimer
+from PySide6.QtCore import QObject, QThread, Signal, Slot, Qt, QSettings, QUrl, QTimer, QMetaObject
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QLineEdit, QFormLayout,
-    QMessageBox, QFrame, QTextEdit, QCheckBox, QSpinBox, QDoubleSpinBox,
+    QMessageBox, QFrame, QTextEdit, QPlainTextEdit, QCheckBox, QSpinBox, QDoubleSpinBox,
     QButtonGroup, QStackedWidget, QSizePolicy, QComboBox
 )
 
 from services.acu_client import ACUClient
-from services.acu_driver import build_frame, parse_sat, parse_place
+from services.acu_driver import build_frame, build_frame_bytes, parse_sat, parse_place
 from components.utils import resource_path
 
+# Read/poll frames never change: encode once, keep the text for the TX log
+_SAT_FRAME = build_frame_bytes("cmd", "sat")
+_SAT_FRAME_TEXT = _SAT_FRAME.decode("ascii").strip()
+_PLACE_FRAME = build_frame_bytes("cmd", "place")
+_PLACE_FRAME_TEXT = _PLACE_FRAME.decode("ascii").strip()
+
+# RX log lines are cut to this many chars; slice first so strip() never walks a long reply
+_RX_LOG_MAX = 6000
+
 
 # ---------------- Worker ----------------
 
 class AcuWorker(QObject):
     connected = Signal(bool)
-    status = Signal(dict)   # emits parsed dict from SHOW / SAT / PLACE / etc.
     error = Signal(str)
-    tx = Signal(str)
-    rx = Signal(str)
+    # tx/rx log lines and parsed status dicts (SHOW / SAT / PLACE / etc.) don't get a signal
+    # each: they go into one outbox deque as ("tx"|"rx"|"status", payload) records, and this
+    # fires only when the UI has drained it since the last record (see drain_outbox)
+    outbox_ready = Signal()
 
     # generic custom command send
     send_command = Signal(str, list, int, float)
@@ -45,27 +57,39 @@ class AcuWorker(QObject):
         self._running = False
         self._client = ACUClient(host=host, port=port)
 
+        # Worker -> UI records; deque append/popleft are atomic, no lock needed
+        self._out = deque(maxlen=8192)  # oldest records drop if the UI falls far behind
+        self._out_kicked = False
+
         self.stream_enabled = True
         self.stream_interval_ms = 1000
         self.stream_sat_enabled = False  # New: for GET-SAT streaming
 
-        self._pending_cmd: tuple[str, list[int], int, float] | None = None
-        self._pending_show: bool = False
-
-        self._pending_sat_read: bool = False
-        self._pending_place_read: bool = False
-        self._pending_sat_apply: tuple[str, str, str, str, str, str, str, int, float] | None = None
-        self._pending_place_apply: tuple[str, str, str, int, float] | None = None
+        # Pending requests: bits of _pending_mask, arguments (if any) in _slots[bit]
+        # (queued from the UI thread, taken by the worker thread: guarded by _pending_lock)
+        self._pending_mask = 0
+        self._slots: dict[int, tuple] = {}
+        self._kick_pending = False  # a _drain_pending call is already posted
+        self._pending_lock = threading.Lock()
+        # Set while a request/stream round is on the wire: a tick that lands meanwhile
+        # (nested event processing, late timer) is skipped instead of queueing more I/O
+        self._in_tick = False
+        self._handlers = (
+            self._do_command, self._do_show, self._do_sat_read,
+            self._do_place_read, self._do_sat_apply, self._do_place_apply,
+        )
 
-        self.send_command.connect(self._queue_command)
-        self.request_show.connect(self._queue_show)
+        # Direct: requests are recorded in the emitting (UI) thread right away, so the worker
+        # sees them even in the middle of a blocking stream round, not only between rounds
+        self.send_command.connect(self._queue_command, Qt.DirectConnection)
+        self.request_show.connect(self._queue_show, Qt.DirectConnection)
 
-        self.request_sat_read.connect(self._queue_sat_read)
-        self.request_place_read.connect(self._queue_place_read)
-        self.request_sat_apply.connect(self._queue_sat_apply)
-        self.request_place_apply.connect(self._queue_place_apply)
+        self.request_sat_read.connect(self._queue_sat_read, Qt.DirectConnection)
+        self.request_place_read.connect(self._queue_place_read, Qt.DirectConnection)
+        self.request_sat_apply.connect(self._queue_sat_apply, Qt.DirectConnection)
+        self.request_place_apply.connect(self._queue_place_apply, Qt.DirectConnection)
         
-        # Timer placeholder (created in start() to ensure thread affinity)
+        # Stream timer placeholder (created in start() to ensure thread affinity)
         self.timer: QTimer | None = None
 
     @Slot()
@@ -74,219 +98,306 @@ class AcuWorker(QObject):
 
         try:
             self._client.connect(timeout=2.0)
-            self.connected.emit(True)
         except Exception as e:
             self.connected.emit(False)
             self.error.emit(f"Connect failed: {e}")
             return
+        if not self._running:
+            # stop() came in while we were still connecting
+            try:
+                self._client.disconnect()
+            except Exception:
+                pass
+            return
+        self.connected.emit(True)
 
-        # Create timer IN THE WORKER THREAD
+        # Create timer IN THE WORKER THREAD. It only paces SHOW/SAT streaming and only
+        # runs while a stream is on; requests are dispatched as soon as they're queued.
         self.timer = QTimer()
-        self.timer.timeout.connect(self._on_tick)
-        self.timer.start(self.stream_interval_ms)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self._on_stream_tick)
+        self._sync_stream_timer()
+
+        # anything queued while we were connecting
+        if self._pending_mask:
+            self._kick()
 
     @Slot()
     def stop(self):
         self._running = False
-        if self.timer:
-            self.timer.stop()
-            self.timer.deleteLater()
-            self.timer = None
-            
+        # Close the socket first: a request blocked on it fails at once instead of running out
+        # its timeout, and the client won't reconnect after an explicit disconnect
         try:
             self._client.disconnect()
         except Exception:
             pass
+
+        if self.timer:
+            if self.thread() != QThread.currentThread():
+                # Called straight from the UI thread: the timer can only be stopped in its own
+                # thread. Queued, never waited on (thread.quit() ends it either way).
+                QMetaObject.invokeMethod(self, "_stop_timer", Qt.QueuedConnection)
+            else:
+                self._stop_timer()
         self.connected.emit(False)
 
     @Slot()
-    def _on_tick(self):
-        if not self._running:
-            return
-
-        # 1) Custom command
-        if self._pending_cmd is not None:
-            frame_code, data_list, retries, timeout = self._pending_cmd
-            self._pending_cmd = None
-            try:
-                parts = [p.strip() for p in frame_code.split(",") if p.strip()]
-                if len(parts) >= 2:
-                    frame_type = parts[0]
-                    code = parts[1]
-                    extra = parts[2:]
-                    frame = build_frame(frame_type, code, *extra)
-                else:
-                    frame = build_frame("cmd", frame_code)
-
-                self.tx.emit(frame.strip())
-                resp = self._client.send_raw(frame, retries=retries, timeout=timeout)
-                self.rx.emit(resp.strip()[:6000])
-
-                low = resp.lower()
-                if ",sat" in low:
-                    parsed = parse_sat(resp)
-                elif ",place" in low:
-                    parsed = parse_place(resp)
-                elif ",show" in low:
-                    parsed = self._client.show(retries=1, timeout=timeout)
-                else:
-                    parsed = {"frame_code": "raw", "raw": resp}
-
-                if isinstance(parsed, dict) and parsed:
-                    self.status.emit(parsed)
+    def _stop_timer(self):
+        if self.timer:
+            self.timer.stop()
+            self.timer.deleteLater()
+            self.timer = None
 
-            except Exception as e:
-                self.error.emit(str(e))
+    def _post(self, kind: str, payload):
+        self._out.append((kind, payload))
+        if not self._out_kicked:
+            self._out_kicked = True
+            self.outbox_ready.emit()
+
+    def drain_outbox(self, limit: int) -> list:
+        """Take up to `limit` records (UI thread). Re-arms outbox_ready before taking."""
+        self._out_kicked = False
+        out = self._out
+        return [out.popleft() for _ in range(min(limit, len(out)))]
+
+    # One bit per request kind; lower bits are handled first (custom command ... PLACE apply)
+    _CMD, _SHOW, _SAT_READ, _PLACE_READ, _SAT_APPLY, _PLACE_APPLY = 1, 2, 4, 8, 16, 32
+
+    def _queue(self, bit: int, args: tuple | None = None):
+        """Record a request (any thread) and make sure the worker gets to it."""
+        with self._pending_lock:
+            if args is not None:
+                self._slots[bit] = args
+            self._pending_mask |= bit
+        self._kick()
+
+    def _kick(self):
+        """
+        Schedule one _drain_pending on the worker's event loop (no-op if one is posted).
+        Safe from any thread: the call is queued to the worker's thread.
+        """
+        with self._pending_lock:
+            if self._kick_pending:
+                return
+            self._kick_pending = True
+        QMetaObject.invokeMethod(self, "_drain_pending", Qt.QueuedConnection)
 
-        # 2) Manual SHOW
-        if self._pending_show:
-            self._pending_show = False
-            try:
-                data = self._client.show(retries=1, timeout=1.0)
-                if isinstance(data, dict):
-                    self.status.emit(data)
-            except Exception as e:
-                self.error.emit(str(e))
+    @Slot()
+    def _drain_pending(self):
+        with self._pending_lock:
+            self._kick_pending = False
+        if not self._running or self.timer is None:
+            return  # not connected (yet): start() kicks again if it gets there
+        if self._in_tick:
+            self._kick()  # requests stay queued; retry once the current round is done
+            return
 
-        # 3) SAT read
-        if self._pending_sat_read:
-            self._pending_sat_read = False
-            try:
-                frame = build_frame("cmd", "sat")
-                self.tx.emit(frame.strip())
-                frame = build_frame("cmd", "sat")
-                self.tx.emit(frame.strip())
-                resp = self._client.send_raw(frame, retries=2, timeout=5.0)
-                self.rx.emit(resp.strip()[:6000])
-                self.rx.emit(resp.strip()[:6000])
-                parsed = parse_sat(resp)
-                self.status.emit(parsed)
-            except Exception as e:
-                self.error.emit(str(e))
+        self._in_tick = True
+        try:
+            self._run_pending()
+        finally:
+            self._in_tick = False
+
+    def _run_pending(self):
+        # 1-6) Queued requests, lowest bit first
+        with self._pending_lock:
+            mask = self._pending_mask
+            self._pending_mask = 0
+            slots, self._slots = self._slots, {}
+        handlers = self._handlers
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            handlers[bit.bit_length() - 1](slots.get(bit))
 
-        # 4) PLACE read
-        if self._pending_place_read:
-            self._pending_place_read = False
-            try:
-                frame = build_frame("cmd", "place")
-                self.tx.emit(frame.strip())
-                frame = build_frame("cmd", "place")
-                self.tx.emit(frame.strip())
-                resp = self._client.send_raw(frame, retries=2, timeout=5.0)
-                self.rx.emit(resp.strip()[:6000])
-                self.rx.emit(resp.strip()[:6000])
-                parsed = parse_place(resp)
-                self.status.emit(parsed)
-            except Exception as e:
-                self.error.emit(str(e))
+    @Slot()
+    def _sync_stream_timer(self):
+        """Run the stream timer only while SHOW or SAT streaming is on (worker thread only)."""
+        if self.timer is None:
+            return
+        if self._running and (self.stream_enabled or self.stream_sat_enabled):
+            if not self.timer.isActive():
+                self.timer.start(self.stream_interval_ms)
+            elif self.timer.interval() != self.stream_interval_ms:
+                self.timer.setInterval(self.stream_interval_ms)
+        else:
+            self.timer.stop()
 
-        # 5) SAT apply
-        if self._pending_sat_apply is not None:
-            args = self._pending_sat_apply
-            self._pending_sat_apply = None
-            try:
-                (
-                    name, center_freq, carrier_freq, carrier_rate,
-                    sat_lon, pol_mode, lock_th, retries, timeout
-                ) = args
-
-                self.tx.emit(f"cmd,sat {name},{center_freq},{carrier_freq},{carrier_rate},{sat_lon},{pol_mode},{lock_th}")
-                parsed = self._client.set_satellite(
-                    name=name,
-                    center_freq=center_freq,
-                    carrier_freq=carrier_freq,
-                    carrier_rate=carrier_rate,
-                    sat_lon=sat_lon,
-                    pol_mode=pol_mode,
-                    lock_th=lock_th,
-                    retries=retries,
-                    timeout=timeout,
-                )
-                if isinstance(parsed, dict):
-                    self.status.emit(parsed)
-            except Exception as e:
-                self.error.emit(str(e))
+    def _request_stream_sync(self):
+        # Stream setters are called straight from the UI thread: hop to the worker's thread
+        # before touching its timer
+        QMetaObject.invokeMethod(self, "_sync_stream_timer", Qt.QueuedConnection)
 
-        # 6) PLACE apply
-        if self._pending_place_apply is not None:
-            args = self._pending_place_apply
-            self._pending_place_apply = None
-            try:
-                lon, lat, heading, retries, timeout = args
-                self.tx.emit(f"cmd,place {lon},{lat},{heading}")
-                parsed = self._client.set_place(
-                    lon=lon,
-                    lat=lat,
-                    heading=heading,
-                    retries=retries,
-                    timeout=timeout,
-                )
-                if isinstance(parsed, dict):
-                    self.status.emit(parsed)
-            except Exception as e:
-                self.error.emit(str(e))
+    @Slot()
+    def _on_stream_tick(self):
+        if not self._running or self._in_tick:
+            return
+        self._in_tick = True
+        try:
+            self._stream_once()
+        finally:
+            self._in_tick = False
 
+    def _stream_once(self):
         # 7) Stream SHOW
         if self.stream_enabled:
             try:
                 data = self._client.show(retries=1, timeout=1.0)
                 if isinstance(data, dict):
-                    self.status.emit(data)
+                    self._post("status", data)
             except Exception as e:
                 self.error.emit(str(e))
                 # Don't break loop (timer keeps running), just log error
 
+        # A request queued while SHOW was on the wire goes next, not after the whole round
+        if self._pending_mask:
+            self._run_pending()
+
         # 8) Stream GET-SAT
         if self.stream_sat_enabled:
             try:
-                frame = build_frame("cmd", "sat")
-                self.tx.emit(frame.strip())
-                resp = self._client.send_raw(frame, retries=1, timeout=1.0)
-                self.rx.emit(resp.strip()[:6000])
+                self._post("tx", _SAT_FRAME_TEXT)
+                resp = self._client.send_raw(_SAT_FRAME, retries=1, timeout=1.0)
+                self._post("rx", resp[:_RX_LOG_MAX].strip())
                 parsed = parse_sat(resp)
                 if isinstance(parsed, dict):
-                    self.status.emit(parsed)
+                    self._post("status", parsed)
             except Exception as e:
                 self.error.emit(f"GET-SAT: {str(e)}")
 
-    @Slot(int)
-    def set_stream_interval(self, ms: int):
-        self.stream_interval_ms = ms
-        if self._running and self.timer.isActive():
-            self.timer.setInterval(self.stream_interval_ms)
+    # 1) Custom command
+    def _do_command(self, args):
+        frame_code, data_list, retries, timeout = args
+        try:
+            parts = [p.strip() for p in frame_code.split(",") if p.strip()]
+            if len(parts) >= 2:
+                frame_type = parts[0]
+                code = parts[1]
+                extra = parts[2:]
+                frame = build_frame_bytes(frame_type, code, *extra)
+            else:
+                frame = build_frame_bytes("cmd", frame_code)
 
-    @Slot()
-    def stop(self):
-        self._running = False
+            self._post("tx", frame.decode("ascii").strip())
+            resp = self._client.send_raw(frame, retries=retries, timeout=timeout)
+            self._post("rx", resp[:_RX_LOG_MAX].strip())
+
+            low = resp.lower()
+            if ",sat" in low:
+                parsed = parse_sat(resp)
+            elif ",place" in low:
+                parsed = parse_place(resp)
+            elif ",show" in low:
+                parsed = self._client.show(retries=1, timeout=timeout)
+            else:
+                parsed = {"frame_code": "raw", "raw": resp}
+
+            if isinstance(parsed, dict) and parsed:
+                self._post("status", parsed)
+
+        except Exception as e:
+            self.error.emit(str(e))
+
+    # 2) Manual SHOW
+    def _do_show(self, _args):
+        try:
+            data = self._client.show(retries=1, timeout=1.0)
+            if isinstance(data, dict):
+                self._post("status", data)
+        except Exception as e:
+            self.error.emit(str(e))
+
+    # 3) SAT read
+    def _do_sat_read(self, _args):
+        self._do_read(_SAT_FRAME, _SAT_FRAME_TEXT, parse_sat)
+
+    # 4) PLACE read
+    def _do_place_read(self, _args):
+        self._do_read(_PLACE_FRAME, _PLACE_FRAME_TEXT, parse_place)
+
+    def _do_read(self, frame: bytes, frame_text: str, parser):
+        """One read request: log TX/RX once each, parse, emit."""
+        try:
+            self._post("tx", frame_text)
+            resp = self._client.send_raw(frame, retries=2, timeout=5.0)
+            self._post("rx", resp[:_RX_LOG_MAX].strip())
+            self._post("status", parser(resp))
+        except Exception as e:
+            self.error.emit(str(e))
+
+    # 5) SAT apply
+    def _do_sat_apply(self, args):
+        try:
+            (
+                name, center_freq, carrier_freq, carrier_rate,
+                sat_lon, pol_mode, lock_th, retries, timeout
+            ) = args
+
+            self._post("tx", f"cmd,sat {name},{center_freq},{carrier_freq},{carrier_rate},{sat_lon},{pol_mode},{lock_th}")
+            parsed = self._client.set_satellite(
+                name=name,
+                center_freq=center_freq,
+                carrier_freq=carrier_freq,
+                carrier_rate=carrier_rate,
+                sat_lon=sat_lon,
+                pol_mode=pol_mode,
+                lock_th=lock_th,
+                retries=retries,
+                timeout=timeout,
+            )
+            if isinstance(parsed, dict):
+                self._post("status", parsed)
+        except Exception as e:
+            self.error.emit(str(e))
+
+    # 6) PLACE apply
+    def _do_place_apply(self, args):
+        try:
+            lon, lat, heading, retries, timeout = args
+            self._post("tx", f"cmd,place {lon},{lat},{heading}")
+            parsed = self._client.set_place(
+                lon=lon,
+                lat=lat,
+                heading=heading,
+                retries=retries,
+                timeout=timeout,
+            )
+            if isinstance(parsed, dict):
+                self._post("status", parsed)
+        except Exception as e:
+            self.error.emit(str(e))
 
     @Slot(bool)
     def set_stream(self, on: bool):
         self.stream_enabled = on
+        self._request_stream_sync()
 
     @Slot(int)
     def set_stream_interval(self, ms: int):
         self.stream_interval_ms = max(100, int(ms))
+        self._request_stream_sync()
 
     @Slot(bool)
     def set_stream_sat(self, on: bool):
         """Enable/disable automatic GET-SAT streaming."""
         self.stream_sat_enabled = on
+        self._request_stream_sync()
 
     @Slot(str, list, int, float)
     def _queue_command(self, frame_code: str, data_list: list[int], retries: int, timeout: float):
-        self._pending_cmd = (frame_code, list(data_list), int(retries), float(timeout))
+        self._queue(self._CMD, (frame_code, list(data_list), int(retries), float(timeout)))
 
     @Slot()
     def _queue_show(self):
-        self._pending_show = True
+        self._queue(self._SHOW)
 
     @Slot()
     def _queue_sat_read(self):
-        self._pending_sat_read = True
+        self._queue(self._SAT_READ)
 
     @Slot()
     def _queue_place_read(self):
-        self._pending_place_read = True
+        self._queue(self._PLACE_READ)
 
     @Slot(str, str, str, str, str, str, str, int, float)
     def _queue_sat_apply(
@@ -301,11 +412,11 @@ class AcuWorker(QObject):
         retries: int,
         timeout: float,
     ):
-        self._pending_sat_apply = (name, center_freq, carrier_freq, carrier_rate, sat_lon, pol_mode, lock_th, int(retries), float(timeout))
+        self._queue(self._SAT_APPLY, (name, center_freq, carrier_freq, carrier_rate, sat_lon, pol_mode, lock_th, int(retries), float(timeout)))
 
     @Slot(str, str, str, int, float)
     def _queue_place_apply(self, lon: str, lat: str, heading: str, retries: int, timeout: float):
-        self._pending_place_apply = (lon, lat, heading, int(retries), float(timeout))
+        self._queue(self._PLACE_APPLY, (lon, lat, heading, int(retries), float(timeout)))
 
 
 # ---------------- UI helpers ----------------
@@ -366,6 +477,18 @@ class AcuNativeView(QWidget):
         super().__init__(parent)
         self.setObjectName("AcuNativeView")
 
+        # Log lines are buffered and written to the consoles in one append per 100 ms
+        self._log_buf = deque(maxlen=4096)      # -> self.log
+        self._log_big_buf = deque(maxlen=4096)  # -> self.log_big (held while paused)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self._log_flush_timer.start(100)
+
+        # SHOW card texts: only changed ones are queued, applied together at most every 50 ms
+        self._last_status: dict[str, str] = {}     # text currently on each card
+        self._pending_status: dict[str, str] = {}  # changed texts waiting for _flush_status
+        self._status_flush_armed = False
+
         self.host_in = QLineEdit("192.168.0.1")
         self.host_in.setObjectName("acuHostInput")
 
@@ -529,8 +652,9 @@ class AcuNativeView(QWidget):
         
         v.addLayout(title_row)
         
-        self.log_big = QTextEdit()
+        self.log_big = QPlainTextEdit()
         self.log_big.setReadOnly(True)
+        self.log_big.setMaximumBlockCount(2000)  # oldest lines drop off
         self._log_paused = False
         v.addWidget(self.log_big, 1)
 
@@ -679,8 +803,9 @@ class AcuNativeView(QWidget):
         log_row.addWidget(self.btn_clear_log)
         root.addLayout(log_row)
 
-        self.log = QTextEdit()
+        self.log = QPlainTextEdit()
         self.log.setReadOnly(True)
+        self.log.setMaximumBlockCount(2000)
         self.log.setMinimumHeight(180)
         root.addWidget(self.log, 1)
 
@@ -725,7 +850,8 @@ class AcuNativeView(QWidget):
 
         # Connection Status Indicator
         self.sat_conn_status = QLabel("Status: Disconnected")
-        self.sat_conn_status.setStyleSheet("color: red; font-weight: bold;")
+        self.sat_conn_status.setObjectName("SatConnStatus")
+        self.sat_conn_status.setProperty("accent", "red")
         l.addWidget(self.sat_conn_status)
 
         self.sat_readout = QTextEdit()
@@ -1188,13 +1314,23 @@ class AcuNativeView(QWidget):
     # ----------------- helpers -----------------
 
     def _append_log(self, s: str):
-        """Append to log consoles, respecting pause state."""
-        if hasattr(self, "log") and self.log:
-            self.log.append(s)
+        """Queue a line for the log consoles (written by _flush_log)."""
+        self._log_buf.append(s)
+        self._log_big_buf.append(s)
+
+    @Slot()
+    def _flush_log(self):
+        """One appendPlainText per console per flush; log_big keeps its lines while paused."""
+        if self._log_buf and hasattr(self, "log") and self.log:
+            text = "\n".join(self._log_buf)
+            self._log_buf.clear()
+            self.log.appendPlainText(text)
             self.log.moveCursor(QTextCursor.End)
 
-        if hasattr(self, "log_big") and self.log_big and not self._log_paused:
-            self.log_big.append(s)
+        if self._log_big_buf and hasattr(self, "log_big") and self.log_big and not self._log_paused:
+            text = "\n".join(self._log_big_buf)
+            self._log_big_buf.clear()
+            self.log_big.appendPlainText(text)
             self.log_big.moveCursor(QTextCursor.End)
 
     @Slot()
@@ -1206,10 +1342,12 @@ class AcuNativeView(QWidget):
             self._append_log("[Log Paused]")
         else:
             self.btn_pause_log.setText("Pause")
-            self.log_big.append("[Log Resumed]")
-            self.log_big.moveCursor(QTextCursor.End)
+            self._log_big_buf.append("[Log Resumed]")
+            self._flush_log()
 
     def _clear_log(self):
+        self._log_buf.clear()
+        self._log_big_buf.clear()
         if hasattr(self, "log") and self.log:
             self.log.clear()
         if hasattr(self, "log_big") and self.log_big:
@@ -1286,10 +1424,8 @@ class AcuNativeView(QWidget):
         self._thread.started.connect(self._worker.start)
 
         self._worker.connected.connect(self._on_connected)
-        self._worker.status.connect(self._on_status)
         self._worker.error.connect(self._on_error)
-        self._worker.tx.connect(lambda msg: self._append_log(f"$ TX: {msg}"))
-        self._worker.rx.connect(lambda msg: self._append_log(f"* RX: {msg}"))
+        self._worker.outbox_ready.connect(self._drain_worker_outbox)
 
         self.btn_connect.setEnabled(False)
         self.btn_disconnect.setEnabled(True)
@@ -1466,10 +1602,12 @@ class AcuNativeView(QWidget):
         if hasattr(self, "sat_conn_status"):
             if ok:
                 self.sat_conn_status.setText("Status: Connected to ACU")
-                self.sat_conn_status.setStyleSheet("color: green; font-weight: bold;")
+                self.sat_conn_status.setProperty("accent", "green")
             else:
                 self.sat_conn_status.setText("Status: Disconnected")
-                self.sat_conn_status.setStyleSheet("color: red; font-weight: bold;")
+                self.sat_conn_status.setProperty("accent", "red")
+            self.sat_conn_status.style().unpolish(self.sat_conn_status)
+            self.sat_conn_status.style().polish(self.sat_conn_status)
 
 
     def _format_polarization(self, pol_value):
@@ -1599,30 +1737,68 @@ class AcuNativeView(QWidget):
         if mode is not None:
             self._set_mode_badge(str(mode))
 
+        pending = self._pending_status
         for k, v in mapping.items():
             if not hasattr(self, "cards") or k not in self.cards or v is None:
                 continue
 
-            if k in (
-                "target_azimuth", "target_elevation", "target_polarization",
-                "current_azimuth", "current_elevation", "current_polarization"
-            ):
-                try:
-                    self.cards[k].value_label.setText(f"{float(v):.2f}°")
-                except Exception:
-                    self.cards[k].value_label.setText(f"{v}°")
-            elif k in ("latitude", "longitude"):
-                try:
-                    self.cards[k].value_label.setText(f"{float(v):.6f}°")
-                except Exception:
-                    self.cards[k].value_label.setText(f"{v}°")
-            elif k == "agc":
-                try:
-                    self.cards[k].value_label.setText(f"{float(v):.0f} V")
-                except Exception:
-                    self.cards[k].value_label.setText(str(v))
+            text = self._card_text(k, v)
+            # compare with what the card will show once queued texts are applied
+            if pending.get(k, self._last_status.get(k)) != text:
+                pending[k] = text
+
+        if pending and not self._status_flush_armed:
+            self._status_flush_armed = True
+            QTimer.singleShot(50, self._flush_status)
+
+    @staticmethod
+    def _card_text(k: str, v) -> str:
+        if k in (
+            "target_azimuth", "target_elevation", "target_polarization",
+            "current_azimuth", "current_elevation", "current_polarization"
+        ):
+            try:
+                return f"{float(v):.2f}°"
+            except Exception:
+                return f"{v}°"
+        elif k in ("latitude", "longitude"):
+            try:
+                return f"{float(v):.6f}°"
+            except Exception:
+                return f"{v}°"
+        elif k == "agc":
+            try:
+                return f"{float(v):.0f} V"
+            except Exception:
+                return str(v)
+        return str(v)
+
+    @Slot()
+    def _flush_status(self):
+        """Apply the queued card texts in one pass (one setText per changed card)."""
+        self._status_flush_armed = False
+        for k, text in self._pending_status.items():
+            self.cards[k].value_label.setText(text)
+        self._last_status.update(self._pending_status)
+        self._pending_status.clear()
+
+    # Records handled per wake; a longer backlog continues 50 ms later
+    _OUTBOX_BATCH = 256
+
+    @Slot()
+    def _drain_worker_outbox(self):
+        if self._worker is None:
+            return
+        records = self._worker.drain_outbox(self._OUTBOX_BATCH)
+        for kind, payload in records:
+            if kind == "status":
+                self._on_status(payload)
+            elif kind == "tx":
+                self._append_log(f"$ TX: {payload}")
             else:
-                self.cards[k].value_label.setText(str(v))
+                self._append_log(f"* RX: {payload}")
+        if len(records) == self._OUTBOX_BATCH:
+            QTimer.singleShot(50, self._drain_worker_outbox)
 
     @Slot(str)
     def _on_error(self, msg: str):
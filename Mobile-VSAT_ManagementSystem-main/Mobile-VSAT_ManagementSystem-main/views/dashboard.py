@@ -17,8 +17,9 @@ from PySide6.QtCore import (
     QSize,
     QPropertyAnimation,
     QEasingCurve,
+    QPointF,
 )
-from PySide6.QtGui import QColor, QPixmap, QImageReader
+from PySide6.QtGui import QColor, QPixmap, QImage, QImageReader, QPainter, QPen
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -54,6 +55,7 @@ class InteractiveMapLabel(QLabel):
     Keeps UI stable; actual tile rendering is done via MapWorker.
     """
     panDelta = Signal(int, int)
+    resized = Signal(int, int)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -62,6 +64,10 @@ class InteractiveMapLabel(QLabel):
         self.setMouseTracking(True)
         self.setCursor(Qt.CursorShape.OpenHandCursor)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.resized.emit(self.width(), self.height())
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             self._dragging = True
@@ -150,7 +156,7 @@ class DashboardView(QWidget):
     TILE_SIZE = 256
 
     # Map request -> worker
-    map_request = Signal(float, float, int, dict)  # lat, lon, zoom, pan_offset
+    map_request = Signal(float, float, int, dict, int, int, int)  # lat, lon, zoom, pan_offset, w, h, request_id
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -183,6 +189,9 @@ class DashboardView(QWidget):
         self._last_render_request = 0.0
         self._render_throttle_s = 0.08
 
+        # Map viewport size in px (tracks the map label; worker renders exactly this)
+        self._map_viewport = (self.TILE_SIZE * 3, self.TILE_SIZE * 3)
+
         # ---- UI ----
         self._init_ui()
 
@@ -393,8 +402,7 @@ class DashboardView(QWidget):
         v.addLayout(header)
 
         self.log_list = QListWidget()
-        self.log_list.setObjectName("TerminalList")
-        self.log_list.setStyleSheet("font-family: 'Consolas', 'Monaco', 'Courier New', monospace;")
+        self.log_list.setObjectName("TerminalList")  # monospace font comes from mainStyle.qss
         v.addWidget(self.log_list)
         return gb
 
@@ -615,6 +623,13 @@ class DashboardView(QWidget):
         self.map_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.map_label.setScaledContents(True)
         self.map_label.panDelta.connect(self._on_map_pan_delta)
+        self.map_label.resized.connect(self._on_map_resized)
+
+        # Debounce resize-driven re-renders while the window is being dragged
+        self._map_resize_timer = QTimer(self)
+        self._map_resize_timer.setSingleShot(True)
+        self._map_resize_timer.setInterval(120)
+        self._map_resize_timer.timeout.connect(self._request_map_render)
         v.addWidget(self.map_label, 1)
 
         controls = self._create_hero_controls()
@@ -647,10 +662,22 @@ class DashboardView(QWidget):
         
         self.log_event("Map worker initialized (offline mode)", level="info")
 
-    @Slot(bytes)
-    def _on_map_load_success(self, image_data: bytes):
-        pix = QPixmap()
-        pix.loadFromData(image_data)
+    @Slot(QImage, float, float)
+    def _on_map_load_success(self, image: QImage, dot_x: float, dot_y: float):
+        # Tiles come from the worker untouched; the marker is painted here
+        pix = QPixmap.fromImage(image)
+        painter = QPainter(pix)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        center = QPointF(dot_x, dot_y)
+        r = 6
+        # Draw marker with white outline for visibility
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor("white"))
+        painter.drawEllipse(center, r + 1, r + 1)
+        painter.setPen(QPen(QColor("black"), 2))
+        painter.setBrush(QColor("red"))
+        painter.drawEllipse(center, r, r)
+        painter.end()
         self.map_label.setPixmap(pix)
 
     @Slot(str)
@@ -663,8 +690,19 @@ class DashboardView(QWidget):
         lon = float(self.data.get("longitude", 0.0))
 
         self.zoom_level_label.setText(f"Zoom: {z}")
-        # Emit correct parameters: lat, lon, zoom, pan_offset dict
-        self.map_request.emit(lat, lon, z, self.map_pan_offset)
+        # Emit correct parameters: lat, lon, zoom, pan_offset dict, viewport size, request id
+        # (a new id makes any render still queued in the worker skip itself)
+        if self.map_worker is None:
+            return
+        w, h = self._map_viewport
+        self.map_request.emit(lat, lon, z, self.map_pan_offset, w, h, self.map_worker.next_request_id())
+
+    @Slot(int, int)
+    def _on_map_resized(self, w: int, h: int):
+        if (w, h) == self._map_viewport or w <= 0 or h <= 0:
+            return
+        self._map_viewport = (w, h)
+        self._map_resize_timer.start()
 
     def _zoom_in(self):
         if self.current_zoom_index < len(self.AVAILABLE_ZOOM_LEVELS) - 1:
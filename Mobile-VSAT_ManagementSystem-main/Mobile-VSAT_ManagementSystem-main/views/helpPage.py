@@ -75,7 +75,7 @@ class HelpPage(QWidget):
         # PDF display label
         self.pdf_label = QLabel("Loading Manual...")
         self.pdf_label.setAlignment(Qt.AlignCenter)
-        self.pdf_label.setStyleSheet("background-color: white; padding: 20px;")
+        self.pdf_label.setObjectName("PdfPageLabel")
         self.pdf_label.setScaledContents(False)
         
         scroll.setWidget(self.pdf_label)
@@ -55,7 +55,7 @@ class ModemView(QWidget):
 
         # ===== URL Configuration Panel =====
         config_panel = QWidget()
-        config_panel.setStyleSheet("background-color: #f5f5f5; padding: 8px;")
+        config_panel.setObjectName("UrlConfigPanel")
         config_layout = QHBoxLayout(config_panel)
         config_layout.setContentsMargins(10, 8, 10, 8)
         config_layout.setSpacing(8)
@@ -66,7 +66,7 @@ class ModemView(QWidget):
         self.url_input.setText(saved_url)
         
         self.btn_load_url = QPushButton("Load URL")
-        self.btn_load_url.setStyleSheet("padding: 6px 16px;")
+        self.btn_load_url.setObjectName("LoadUrlButton")
         
         config_layout.addWidget(url_label)
         config_layout.addWidget(self.url_input, 1)